@@ -1,12 +1,22 @@
 import asyncio
+import functools
+import heapq
 import json
+import operator
+import random
+import sys
 import time
-from dataclasses import dataclass
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
 import websockets
+from sortedcontainers import SortedKeyList
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import OrderArgs, OrderType
+from py_clob_client.clob_types import OrderArgs, OrderType, PostOrdersArgs
 from py_clob_client.order_builder.constants import BUY
 from py_clob_client.constants import POLYGON
 from backend.config import Config
@@ -22,69 +32,107 @@ from backend.services.time_patterns import TimePatternAnalyzer, MomentumDetector
 
 # Constants
 MAX_EXECUTION_WINDOW = 20  # seconds
+WS_DRAIN_TIMEOUT = 0.001  # seconds to wait for an already-queued WS message
+WS_MAX_BATCH = 100  # max messages coalesced before running arb checks
+WS_SUBSCRIBE_CHUNK = 200  # token ids per batched subscribe message
+ORDER_POOL_WORKERS = 4  # both legs of two concurrent trades
+CLOB_POOL_WORKERS = 2  # market fetches and order metadata warm-up
+MAX_TRACKED_POSITIONS = 10_000  # oldest positions drop off beyond this
+TIME_PATTERN_TTL = 10.0  # seconds; hour/day trading periods change far slower
+TRADE_WRITE_QUEUE_SIZE = 1000  # pending trade inserts before saving inline
+ORDER_METADATA_REQUESTS = 3  # HTTP GETs per token in _load_order_metadata
+
+# C-level sort key (avoids a Python frame per comparison)
+_ROI_KEY = operator.attrgetter('roi')
 
 
 # ============================================
-# OPTIMIZATION 1: Cooldown Manager
+# OPTIMIZATIONS 1-2: Market Gate (cooldown + execution lock)
 # ============================================
-class CooldownManager:
-    """
-    Prevents spam trading by enforcing a cooldown period per market.
+class MarketGate:
     """
-    def __init__(self, cooldown_seconds: float = 30.0):
-        self.last_trade: Dict[str, float] = {}
-        self.cooldown = cooldown_seconds
-
-    def can_trade(self, market_id: str) -> bool:
-        """Check if enough time has passed since last trade on this market."""
-        last = self.last_trade.get(market_id, 0)
-        return time.time() - last > self.cooldown
-
-    def record_trade(self, market_id: str):
-        """Record a trade timestamp for cooldown tracking."""
-        self.last_trade[market_id] = time.time()
-
-    def time_remaining(self, market_id: str) -> float:
-        """Returns seconds remaining in cooldown, 0 if can trade."""
-        last = self.last_trade.get(market_id, 0)
-        remaining = self.cooldown - (time.time() - last)
-        return max(0, remaining)
+    Cooldown and execution lock for each market, fused behind one dict lookup.
 
+    Each entry is [last_trade, executing]; a market without an entry is
+    idle and out of cooldown. Lock-free: try_enter checks and sets with
+    no `await` in between, so it is atomic on the single-threaded event
+    loop. Timestamps come from time.monotonic().
 
-# ============================================
-# OPTIMIZATION 2: Execution Lock
-# ============================================
-class ExecutionLock:
+    Memory stays bounded by the markets traded recently: an idle entry is
+    dropped once its cooldown expired a full extra cooldown ago, found
+    through a min-heap of expiries rather than a scan.
     """
-    Prevents duplicate execution on the same market.
-    Thread-safe async lock.
-    """
-    def __init__(self):
-        self.executing: Set[str] = set()
-        self._lock = asyncio.Lock()
-
-    async def acquire(self, market_id: str) -> bool:
-        """Try to acquire lock for a market. Returns False if already executing."""
-        async with self._lock:
-            if market_id in self.executing:
-                return False
-            self.executing.add(market_id)
-            return True
-
-    async def release(self, market_id: str):
-        """Release the lock for a market."""
-        async with self._lock:
-            self.executing.discard(market_id)
+    __slots__ = ('cooldown', '_state', '_expiry_heap')
 
-    def is_executing(self, market_id: str) -> bool:
-        """Check if a market is currently being executed."""
-        return market_id in self.executing
+    def __init__(self, cooldown_seconds: float = 30.0):
+        self.cooldown = cooldown_seconds
+        self._state: Dict[str, list] = {}
+        # Min-heap of (cooldown_expiry, market_id), superseded entries skipped lazily
+        self._expiry_heap: List[Tuple[float, str]] = []
+
+    def status(self, market_id: str, now: Optional[float] = None) -> Tuple[bool, float]:
+        """Return (is_executing, cooldown seconds remaining) for a market."""
+        state = self._state.get(market_id)
+        if state is None:
+            return False, 0
+        last, executing = state
+        if last is None:
+            return executing, 0
+        if now is None:
+            now = time.monotonic()
+        return executing, max(0, self.cooldown - (now - last))
+
+    def try_enter(self, market_id: str, now: Optional[float] = None) -> bool:
+        """Claim a market for execution. False if executing or in cooldown."""
+        state = self._state.get(market_id)
+        if state is None:
+            self._state[market_id] = [None, True]
+            return True
+        last, executing = state
+        if executing:
+            return False
+        if last is not None:
+            if now is None:
+                now = time.monotonic()
+            if now - last <= self.cooldown:
+                return False
+        state[1] = True
+        return True
+
+    def exit(self, market_id: str, traded: bool = False, now: Optional[float] = None):
+        """Release a market; a completed trade starts its cooldown."""
+        if traded:
+            if now is None:
+                now = time.monotonic()
+            # Expired entries of other markets, left for a full extra cooldown
+            self._drain(now - self.cooldown)
+        state = self._state.get(market_id)
+        if state is None:
+            return
+        if traded:
+            state[0] = now
+            state[1] = False
+            heapq.heappush(self._expiry_heap, (now + self.cooldown, market_id))
+        elif state[0] is None:
+            del self._state[market_id]
+        else:
+            state[1] = False
+
+    def _drain(self, cutoff: float):
+        """Forget idle markets whose cooldown expired before cutoff."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] < cutoff:
+            expiry, market_id = heapq.heappop(heap)
+            state = self._state.get(market_id)
+            if (state is not None and not state[1] and state[0] is not None
+                    and state[0] + self.cooldown == expiry):
+                del self._state[market_id]
 
 
 # ============================================
 # OPTIMIZATION 3: Opportunity Cache
 # ============================================
-@dataclass
+@dataclass(slots=True)
 class OpportunityCache:
     """Cached arbitrage opportunity with metadata."""
     market_id: str
@@ -98,6 +146,7 @@ class OpportunityCache:
     executed: bool = False
     market_score: float = 0.0  # PHASE 5: Market quality score
     momentum: str = "NEW"      # PHASE 5: IMPROVING, STABLE, DEGRADING, NEW
+    priority_score: float = 1.0  # Momentum priority, computed with `momentum`
 
 
 class OpportunityManager:
@@ -105,71 +154,181 @@ class OpportunityManager:
     Manages and caches arbitrage opportunities.
     Enables profitability ranking and deduplication.
     """
-    def __init__(self, min_profit_margin: float):
+    __slots__ = ('opportunities', '_executed', '_by_roi', '_min_margin', '_cost_threshold',
+                 '_ttl', '_high_watermark', '_momentum_detector')
+
+    def __init__(self, min_profit_margin: float, max_age: float = 60.0,
+                 high_watermark: int = 1000):
+        # Live opportunities; executed ones are moved out to _executed so
+        # ranking never has to filter them
         self.opportunities: Dict[str, OpportunityCache] = {}
-        self.min_margin = min_profit_margin
+        self._executed: Dict[str, OpportunityCache] = {}
+        # Live opportunities kept sorted by ROI (ascending; read in reverse)
+        self._by_roi = SortedKeyList(key=_ROI_KEY)
+        self.min_margin = min_profit_margin  # also sets _cost_threshold
+        # Entries older than the TTL are evicted lazily as reads touch them
+        self._ttl = max_age
+        self._high_watermark = high_watermark
         self._momentum_detector = MomentumDetector(lookback_seconds=60)
 
+    @property
+    def min_margin(self) -> float:
+        return self._min_margin
+
+    @min_margin.setter
+    def min_margin(self, value: float):
+        # Cost must stay strictly below this to count as an opportunity
+        self._min_margin = value
+        self._cost_threshold = 1.0 - value
+
     def update(self, market_id: str, yes_token: str, no_token: str,
                yes_price: float, no_price: float,
-               market_score: float = 0.0) -> Optional[OpportunityCache]:
-        """Update opportunity cache. Returns opportunity if profitable."""
-        cost = yes_price + no_price
-        target = 1.0 - self.min_margin
+               market_score: float = 0.0,
+               now: Optional[float] = None) -> Optional[OpportunityCache]:
+        """
+        Update opportunity cache. Returns opportunity if profitable.
 
-        if cost < target and cost > 0:
+        `now` is a time.monotonic() reading, taken once per message by the
+        caller; defaults to reading the clock.
+        """
+        if now is None:
+            now = time.monotonic()
+        cost = yes_price + no_price
+        target = self._cost_threshold
+
+        # Popped so the re-insert below moves the market to the end: live
+        # entries stay ordered oldest-update-first for clear_stale()
+        old = self.opportunities.pop(market_id, None)
+        if old is not None:
+            self._by_roi.discard(old)
+        else:
+            # A repriced executed market becomes live again
+            old = self._executed.pop(market_id, None)
+
+        if 0 < cost < target:
             roi = (1.0 - cost) / cost * 100
 
             # PHASE 5: Detect momentum
-            self._momentum_detector.record_cost(market_id, cost)
-            momentum = self._momentum_detector.detect_momentum(market_id, cost)
-
-            opp = OpportunityCache(
-                market_id=market_id,
-                yes_token=yes_token,
-                no_token=no_token,
-                yes_price=yes_price,
-                no_price=no_price,
-                cost=cost,
-                roi=roi,
-                timestamp=time.time(),
-                market_score=market_score,
-                momentum=momentum
-            )
-            self.opportunities[market_id] = opp
+            momentum = self._momentum_detector.record_and_detect(market_id, cost)
+            priority_score = MomentumDetector.priority_for(momentum)
+
+            if old is not None:
+                # Reuse the cached instance: only the prices changed
+                opp = old
+                opp.yes_token = yes_token
+                opp.no_token = no_token
+                opp.yes_price = yes_price
+                opp.no_price = no_price
+                opp.cost = cost
+                opp.roi = roi
+                opp.timestamp = now
+                opp.executed = False
+                opp.market_score = market_score
+                opp.momentum = momentum
+                opp.priority_score = priority_score
+                self.opportunities[market_id] = opp
+            else:
+                opp = OpportunityCache(
+                    market_id=market_id,
+                    yes_token=yes_token,
+                    no_token=no_token,
+                    yes_price=yes_price,
+                    no_price=no_price,
+                    cost=cost,
+                    roi=roi,
+                    timestamp=now,
+                    market_score=market_score,
+                    momentum=momentum,
+                    priority_score=priority_score
+                )
+                self.opportunities[market_id] = opp
+            self._by_roi.add(opp)
             return opp
 
-        # Remove if no longer profitable
-        self.opportunities.pop(market_id, None)
+        # No longer profitable: already dropped by the pop above
         return None
 
     def get_priority_score(self, market_id: str) -> float:
-        """Get execution priority score based on momentum."""
-        opp = self.opportunities.get(market_id)
+        """Get execution priority score based on momentum (cached by update())."""
+        opp = self._lookup(market_id)
         if not opp:
             return 1.0
-        return self._momentum_detector.get_priority_score(market_id, opp.cost)
+        return opp.priority_score
 
     def get_best(self, n: int = 5) -> List[OpportunityCache]:
         """Returns the N best opportunities sorted by ROI (descending)."""
-        valid = [o for o in self.opportunities.values() if not o.executed]
-        return sorted(valid, key=lambda x: x.roi, reverse=True)[:n]
+        now = time.monotonic()
+        best = []
+        expired = []
+        for o in reversed(self._by_roi):
+            if now - o.timestamp > self._ttl:
+                expired.append(o.market_id)
+                continue
+            best.append(o)
+            if len(best) >= n:
+                break
+        for market_id in expired:
+            self._evict(market_id)
+        return best
 
     def mark_executed(self, market_id: str):
         """Mark an opportunity as executed."""
-        if market_id in self.opportunities:
-            self.opportunities[market_id].executed = True
+        opp = self.opportunities.pop(market_id, None)
+        if opp is not None:
+            self._by_roi.discard(opp)
+            opp.executed = True
+            self._executed[market_id] = opp
 
     def get(self, market_id: str) -> Optional[OpportunityCache]:
-        """Get a specific opportunity."""
-        return self.opportunities.get(market_id)
+        """Get a specific opportunity (None if missing or past its TTL)."""
+        opp = self._lookup(market_id)
+        if opp is not None and time.monotonic() - opp.timestamp > self._ttl:
+            self._evict(market_id)
+            return None
+        return opp
+
+    def clear_stale(self, max_age: float = 60.0, now: Optional[float] = None):
+        """
+        Remove opportunities older than max_age seconds.
+
+        This is only garbage collection for markets that stopped streaming.
+        Reads already evict expired entries lazily, so the sweep is skipped
+        until the cache grows past the high watermark. Live entries are kept
+        in update order, so their sweep is O(stale) rather than O(cache).
+        """
+        if len(self.opportunities) + len(self._executed) <= self._high_watermark:
+            return
+        if now is None:
+            now = time.monotonic()
+
+        # Live entries are in update order, so stop at the first fresh one
+        live = self.opportunities
+        while live:
+            oldest = next(iter(live.values()))
+            if now - oldest.timestamp <= max_age:
+                break
+            self._evict(oldest.market_id)
 
-    def clear_stale(self, max_age: float = 60.0):
-        """Remove opportunities older than max_age seconds."""
-        now = time.time()
-        stale = [k for k, v in self.opportunities.items() if now - v.timestamp > max_age]
+        # Executed entries are never in the ROI index, so drop them directly
+        executed = self._executed
+        stale = [k for k, v in executed.items() if now - v.timestamp > max_age]
         for k in stale:
-            del self.opportunities[k]
+            del executed[k]
+
+    def _lookup(self, market_id: str) -> Optional[OpportunityCache]:
+        """Find a market among live or executed opportunities."""
+        opp = self.opportunities.get(market_id)
+        if opp is None:
+            opp = self._executed.get(market_id)
+        return opp
+
+    def _evict(self, market_id: str):
+        """Drop a market from the cache and the ROI index."""
+        opp = self.opportunities.pop(market_id, None)
+        if opp is not None:
+            self._by_roi.discard(opp)
+        else:
+            self._executed.pop(market_id, None)
 
 
 # ============================================
@@ -179,17 +338,17 @@ def check_slippage(expected_cost: float, current_cost: float, max_slippage: floa
     """
     Check if slippage is within acceptable range.
     Returns True if slippage is acceptable, False otherwise.
+
+    Compares |current - expected| against max_slippage * expected, which is
+    equivalent for expected > 0 and avoids a division.
     """
-    if expected_cost <= 0:
-        return False
-    slippage = abs(current_cost - expected_cost) / expected_cost
-    return slippage <= max_slippage
+    return expected_cost > 0 and abs(current_cost - expected_cost) <= max_slippage * expected_cost
 
 
 # ============================================
 # MARKET IMPACT CALCULATOR (CRITICAL)
 # ============================================
-@dataclass
+@dataclass(slots=True)
 class MarketImpactResult:
     """Result of market impact calculation."""
     shares: float
@@ -199,6 +358,106 @@ class MarketImpactResult:
     has_sufficient_liquidity: bool
 
 
+# Parsed ask side: (prices, sizes, cumulative sizes, cumulative costs),
+# price ascending
+BookArrays = Tuple[List[float], List[float], List[float], List[float]]
+
+
+def _prepare_book(order_book: List[dict], max_depth: Optional[int] = None) -> BookArrays:
+    """
+    Parse a list of {price, size} levels once into parallel float lists.
+
+    Empty levels are dropped. The running size total lets the fill level
+    be found by bisection, and the running cost total prices every fully
+    consumed level in one lookup, so no fill walks the book. Levels are
+    put in ascending price order if the feed sent them otherwise, before
+    the book is cut to max_depth, so the calculators never see a
+    mis-ordered book.
+    """
+    prices: List[float] = []
+    sizes: List[float] = []
+    for level in order_book:
+        size = float(level.get('size', 0))
+        if size > 0:
+            prices.append(float(level['price']))
+            sizes.append(size)
+
+    if not all(map(operator.le, prices, prices[1:])):
+        order = sorted(range(len(prices)), key=prices.__getitem__)
+        prices = [prices[i] for i in order]
+        sizes = [sizes[i] for i in order]
+
+    if max_depth is not None:
+        del prices[max_depth:], sizes[max_depth:]
+    return (
+        prices, sizes,
+        list(accumulate(sizes)),
+        list(accumulate(map(operator.mul, prices, sizes)))
+    )
+
+
+@dataclass(slots=True)
+class BookSide:
+    """
+    One side of a token's book, parsed once per WS update.
+
+    Stored as parallel float lists (structure of arrays) instead of a list
+    of {price, size} dicts, so the calculators read plain floats. version
+    increments on every replacement of the side.
+    """
+    prices: List[float] = field(default_factory=list)
+    sizes: List[float] = field(default_factory=list)
+    cumsize: List[float] = field(default_factory=list)
+    cumcost: List[float] = field(default_factory=list)
+    version: int = 0
+
+    @classmethod
+    def from_levels(cls, levels: List[dict], version: int = 0,
+                    max_depth: Optional[int] = None) -> 'BookSide':
+        """Build from raw {price, size} levels (see _prepare_book)."""
+        return cls(*_prepare_book(levels, max_depth), version)
+
+
+_EMPTY_SIDE = BookSide()
+
+# Anything the calculators accept as an order book
+OrderBookInput = Union[List[dict], BookArrays, BookSide]
+
+
+def _as_book_arrays(order_book: OrderBookInput) -> BookArrays:
+    """Accept a raw level list, a BookSide or an already prepared tuple."""
+    if isinstance(order_book, BookSide):
+        return order_book.prices, order_book.sizes, order_book.cumsize, order_book.cumcost
+    if isinstance(order_book, tuple):
+        return order_book
+    return _prepare_book(order_book)
+
+
+def _fill_cost(
+    prices: List[float],
+    cumsize: List[float],
+    cumcost: List[float],
+    shares_needed: float
+) -> Tuple[float, float, int]:
+    """
+    Numeric core of the effective-cost walk: (total_cost, shares_filled, levels).
+
+    Works on plain floats only, so hot paths that just need a price can
+    skip building a MarketImpactResult. The book must be non-empty and
+    shares_needed positive.
+    """
+    k = bisect_left(cumsize, shares_needed)
+
+    if k == len(cumsize):
+        return cumcost[-1], cumsize[-1], k
+
+    if k:
+        total_cost = cumcost[k - 1] + prices[k] * (shares_needed - cumsize[k - 1])
+    else:
+        total_cost = prices[0] * shares_needed
+    return total_cost, shares_needed, k + 1
+
+
 class MarketImpactCalculator:
     """
     Calculates the real cost of executing orders across order book depth.
@@ -210,119 +469,133 @@ class MarketImpactCalculator:
     """
 
     @staticmethod
-    def calculate_effective_cost(order_book: List[dict], shares_needed: float) -> MarketImpactResult:
+    def calculate_effective_cost(
+        order_book: OrderBookInput,
+        shares_needed: float
+    ) -> MarketImpactResult:
         """
         Calculate the average price to buy X shares across multiple price levels.
 
         Args:
-            order_book: List of {price, size} sorted by price ascending (asks)
+            order_book: List of {price, size} sorted by price ascending (asks),
+                or the same book already parsed (BookSide or _prepare_book())
             shares_needed: Number of shares to buy
 
         Returns:
             MarketImpactResult with effective price and liquidity info
         """
-        if not order_book or shares_needed <= 0:
-            return MarketImpactResult(0, 0, 0, 0, False)
-
-        total_cost = 0.0
-        shares_filled = 0.0
-        levels_consumed = 0
-
-        for level in order_book:
-            price = float(level['price'])
-            size = float(level.get('size', 0))
-
-            if size <= 0:
-                continue
-
-            shares_to_take = min(shares_needed - shares_filled, size)
-            total_cost += shares_to_take * price
-            shares_filled += shares_to_take
-            levels_consumed += 1
+        return MarketImpactCalculator.calculate_effective_cost_from_arrays(
+            *_as_book_arrays(order_book), shares_needed
+        )
 
-            if shares_filled >= shares_needed:
-                break
+    @staticmethod
+    def calculate_effective_cost_from_arrays(
+        prices: List[float],
+        sizes: List[float],
+        cumsize: List[float],
+        cumcost: List[float],
+        shares_needed: float
+    ) -> MarketImpactResult:
+        """
+        Same as calculate_effective_cost, on a book parsed by _prepare_book().
 
-        if shares_filled < shares_needed:
-            return MarketImpactResult(
-                shares=shares_filled,
-                effective_price=total_cost / shares_filled if shares_filled > 0 else 0,
-                total_cost=total_cost,
-                levels_consumed=levels_consumed,
-                has_sufficient_liquidity=False
-            )
+        The fill level is located by bisecting the cumulative sizes and the
+        levels before it are priced from the cumulative costs, so no
+        per-level work happens on the hot path.
+        """
+        if not prices or shares_needed <= 0:
+            return MarketImpactResult(0, 0, 0, 0, False)
 
+        total_cost, shares_filled, levels = _fill_cost(prices, cumsize, cumcost, shares_needed)
         return MarketImpactResult(
-            shares=shares_needed,
-            effective_price=total_cost / shares_needed,
+            shares=shares_filled,
+            effective_price=total_cost / shares_filled,
             total_cost=total_cost,
-            levels_consumed=levels_consumed,
-            has_sufficient_liquidity=True
+            levels_consumed=levels,
+            has_sufficient_liquidity=shares_filled == shares_needed
         )
 
     @staticmethod
     def find_optimal_trade_size(
-        yes_book: List[dict],
-        no_book: List[dict],
+        yes_book: OrderBookInput,
+        no_book: OrderBookInput,
         max_combined_cost: float = 0.98,
         max_shares: float = 1000,
         precision: float = 0.1
     ) -> Tuple[float, float, float]:
         """
-        Binary search to find maximum shares where effective_yes + effective_no < max_cost.
+        Find the maximum shares where effective_yes + effective_no < max_cost.
+
+        Each book's total cost is piecewise linear in shares, with
+        breakpoints where a level is used up. Between two consecutive
+        breakpoints of the merged books the combined average cost is
+        F / s + p (p = sum of current level prices). It is non-decreasing,
+        so one walk over the breakpoints finds the segment where it crosses
+        max_cost, and that segment is solved for s exactly. This costs
+        O(levels_yes + levels_no) instead of repeated full book walks.
 
         Args:
-            yes_book: YES token order book (asks)
-            no_book: NO token order book (asks)
+            yes_book: YES token order book (asks), raw or prepared
+            no_book: NO token order book (asks), raw or prepared
             max_combined_cost: Maximum acceptable combined cost (default 0.98)
             max_shares: Maximum shares to consider
-            precision: Search precision in shares
+            precision: Safety margin in shares kept below the exact break-even
+                size and below the available depth
 
         Returns:
             Tuple of (optimal_shares, effective_yes_price, effective_no_price)
             Returns (0, 0, 0) if no profitable size exists
         """
-        low, high = 0.0, max_shares
-        best_shares = 0.0
-        best_yes_price = 0.0
-        best_no_price = 0.0
-
-        # First check if even 1 share is profitable
-        yes_result = MarketImpactCalculator.calculate_effective_cost(yes_book, 1.0)
-        no_result = MarketImpactCalculator.calculate_effective_cost(no_book, 1.0)
+        p_yes, _, cum_yes, cost_cum_yes = _as_book_arrays(yes_book)
+        p_no, _, cum_no, cost_cum_no = _as_book_arrays(no_book)
 
-        if not yes_result.has_sufficient_liquidity or not no_result.has_sufficient_liquidity:
+        # First check if even 1 share is available and profitable
+        if not cum_yes or not cum_no or cum_yes[-1] < 1.0 or cum_no[-1] < 1.0:
             return 0.0, 0.0, 0.0
 
-        if yes_result.effective_price + no_result.effective_price >= max_combined_cost:
+        if (_fill_cost(p_yes, cum_yes, cost_cum_yes, 1.0)[0] +
+                _fill_cost(p_no, cum_no, cost_cum_no, 1.0)[0]) >= max_combined_cost:
             return 0.0, 0.0, 0.0  # Not profitable at any size
 
-        # Binary search for optimal size
-        iterations = 0
-        max_iterations = 50  # Prevent infinite loop
-
-        while high - low > precision and iterations < max_iterations:
-            iterations += 1
-            mid = (low + high) / 2
-
-            yes_result = MarketImpactCalculator.calculate_effective_cost(yes_book, mid)
-            no_result = MarketImpactCalculator.calculate_effective_cost(no_book, mid)
-
-            if not yes_result.has_sufficient_liquidity or not no_result.has_sufficient_liquidity:
-                high = mid
-                continue
-
-            combined_cost = yes_result.effective_price + no_result.effective_price
-
-            if combined_cost < max_combined_cost:
-                best_shares = mid
-                best_yes_price = yes_result.effective_price
-                best_no_price = no_result.effective_price
-                low = mid
-            else:
-                high = mid
+        # Keep the same safety margin below the available depth as below the
+        # break-even size, so rounding the result can't exceed the book
+        depth = min(cum_yes[-1], cum_no[-1])
+        cap = min(max_shares, max(depth - precision, 1.0))
+        shares = cap
+
+        # Walk merged breakpoints: i/j index the level being consumed on each
+        # side, cost_* is the cost of all fully consumed levels before it
+        i = j = 0
+        filled_yes = filled_no = 0.0
+        cost_yes = cost_no = 0.0
+        while True:
+            end = min(cum_yes[i], cum_no[j], cap)
+            p = p_yes[i] + p_no[j]
+            fixed = (cost_yes - p_yes[i] * filled_yes) + (cost_no - p_no[j] * filled_no)
+
+            if fixed / end + p >= max_combined_cost:
+                # Crossing inside this segment: solve fixed / s + p = max_cost
+                start = max(filled_yes, filled_no)
+                crossing = fixed / (max_combined_cost - p) if p > max_combined_cost else start
+                shares = min(cap, max(min(crossing, end) - precision, 1.0))
+                break
 
-        return best_shares, best_yes_price, best_no_price
+            if end >= cap:
+                break
+            if end >= cum_yes[i]:
+                cost_yes = cost_cum_yes[i]
+                filled_yes = cum_yes[i]
+                i += 1
+            if end >= cum_no[j]:
+                cost_no = cost_cum_no[j]
+                filled_no = cum_no[j]
+                j += 1
+
+        return (
+            shares,
+            _fill_cost(p_yes, cum_yes, cost_cum_yes, shares)[0] / shares,
+            _fill_cost(p_no, cum_no, cost_cum_no, shares)[0] / shares
+        )
 
     @staticmethod
     def get_max_profitable_investment(
@@ -351,14 +624,43 @@ class MarketImpactCalculator:
         return investment, profit
 
 
+def _merge_book_update(batch: Dict[str, dict], data: dict):
+    """
+    Fold one WS message into a per-token batch.
+
+    Later keys win, so a token's batched update carries its latest asks
+    and its latest bids even when they arrived in separate messages.
+    Messages without a token_id carry no book data and are dropped.
+    """
+    if isinstance(data, dict) and 'token_id' in data:
+        pending = batch.get(data['token_id'])
+        if pending is None:
+            batch[data['token_id']] = data
+        else:
+            pending.update(data)
+
+
+def _merge_ws_message(batch: Dict[str, dict], msg) -> None:
+    """Decode one raw WS frame into the batch, dropping it if malformed."""
+    try:
+        _merge_book_update(batch, json.loads(msg))
+    except (ValueError, TypeError) as e:
+        logger.error(f"Dropping malformed WS message: {e}")
+
+
 class ArbitrageBot:
     def __init__(self, config: Config):
         self.config = config
         self.running = False
-        self.positions: List[dict] = []
+        self.positions: Deque[dict] = deque(maxlen=MAX_TRACKED_POSITIONS)
+        self._positions_by_market: Dict[str, List[dict]] = {}  # market_id -> positions
+        self._open_positions_count = 0  # tracked positions with status EXECUTED
         self.order_books: Dict[str, dict] = {} # market_id -> {bids: [], asks: []}
+        self._asks_by_token: Dict[str, BookSide] = {} # token_id -> parsed asks (flat hot-path lookup)
         self.market_details: Dict[str, dict] = {} # condition_id -> market_info
         self.token_to_market: Dict[str, str] = {} # token_id -> market_id (for fast O(1) lookup)
+        self.token_dispatch: Dict[str, Tuple[str, str, str]] = {} # token_id -> (market_id, yes_token, no_token)
+        self._market_tokens: Dict[str, Tuple[str, str]] = {} # market_id -> (yes_token, no_token)
         self.markets_whitelist: List[str] = [] # condition_ids or token_ids
         self.on_opportunity = None # Callback function(market_id, yes_price, no_price)
         self.on_trade = None # Callback function(trade_dict) for trade history
@@ -370,13 +672,29 @@ class ArbitrageBot:
         self.max_reconnect_attempts = 10
         self.base_reconnect_delay = 5  # seconds
         self.max_reconnect_delay = 60  # seconds
+        # Exponential backoff with cap, one entry per attempt
+        self._backoff_delays = tuple(
+            min(self.base_reconnect_delay * (1 << i), self.max_reconnect_delay)
+            for i in range(self.max_reconnect_attempts)
+        )
 
         # ============================================
         # OPTIMIZATION MANAGERS
         # ============================================
-        self.cooldown_manager = CooldownManager(config.COOLDOWN_SECONDS)
-        self.execution_lock = ExecutionLock()
+        # Cooldown + execution lock per market, one lookup per check
+        self.market_gate = MarketGate(config.COOLDOWN_SECONDS)
         self.opportunity_manager = OpportunityManager(config.MIN_PROFIT_MARGIN)
+        # Profitability thresholds; config does not change at runtime.
+        # Fee is applied twice (once for YES, once for NO)
+        self._fee_multiplier = 1.0 + (config.TRADING_FEE_PERCENT * 2)
+        self._target_cost = 1.0 - config.MIN_PROFIT_MARGIN
+        self._target_cost_with_fees = self._target_cost / self._fee_multiplier
+        # Max shares we might want based on capital (rough estimate)
+        self._max_possible_shares = config.CAPITAL_PER_TRADE / 0.5
+        # market_id -> (yes, no) ask versions last rejected on price alone
+        self._rejected_versions: Dict[str, Tuple[int, int]] = {}
+        # (expires_at, trading period, time multiplier), see _get_time_context
+        self._time_context: Tuple[float, str, float] = (float('-inf'), 'NORMAL', 1.0)
 
         # ============================================
         # PHASE 5: CAPITAL ALLOCATOR & TIME PATTERNS
@@ -392,7 +710,23 @@ class ArbitrageBot:
         # PHASE 2: ADVANCED SERVICES
         # ============================================
         self.trade_storage = TradeStorage()
+        # Trades are persisted by _trade_writer in batches, off the execution path
+        self._trade_write_queue: asyncio.Queue = asyncio.Queue(maxsize=TRADE_WRITE_QUEUE_SIZE)
+        self._trade_writer_task: Optional[asyncio.Task] = None
         self.rate_limiter = APIRateLimiter()
+        # Order placement gets its own threads so it never queues behind
+        # market fetches or other blocking work on the default executor
+        self._order_pool = ThreadPoolExecutor(
+            max_workers=ORDER_POOL_WORKERS, thread_name_prefix='order'
+        )
+        # Other blocking CLOB reads, kept off the shared default executor
+        self._clob_pool = ThreadPoolExecutor(
+            max_workers=CLOB_POOL_WORKERS, thread_name_prefix='clob'
+        )
+        self._order_warmup_task: Optional[asyncio.Task] = None
+        self._warmed_tokens: Set[str] = set()  # order metadata already cached by the client
+        # Sell-backs of legs whose hedge failed to fill
+        self._unwind_tasks: Set[asyncio.Task] = set()
         self.risk_manager = RiskManager.from_config(config)
         
         # Initialize Clob Client (Synchronous)
@@ -429,12 +763,16 @@ class ArbitrageBot:
         # PHASE 3: POSITION MONITORING & BALANCE
         # ============================================
         self.balance_manager = BalanceManager(self.client, config.FALLBACK_BALANCE)
-        self.exit_executor = ExitExecutor(self.client, self.rate_limiter)
+        self.exit_executor = ExitExecutor(self.client, self.rate_limiter, executor=self._order_pool)
         self.position_monitor = PositionMonitor(
             risk_manager=self.risk_manager,
             check_interval=5.0,
             on_exit_signal=self._handle_exit_signal
         )
+        # The monitor reads these containers live; they are mutated in
+        # place, so handing them over once replaces a re-send per message
+        self.position_monitor.update_order_books(self.order_books)
+        self.position_monitor.update_positions(self.positions)
 
         # ============================================
         # PHASE 4: PAPER TRADING & DATA COLLECTION
@@ -477,7 +815,7 @@ class ArbitrageBot:
 
         if result.get('success'):
             # Update position status
-            position['status'] = 'CLOSED'
+            self._mark_position_closed(position)
             position['exit_reason'] = reason
             position['exit_value'] = result.get('exit_value')
             position['realized_pnl'] = result.get('realized_pnl')
@@ -500,22 +838,142 @@ class ArbitrageBot:
 
     def _get_position_prices(self, position: dict) -> tuple:
         """Get current prices for a position."""
-        market_id = position.get('market_id')
-        market = self.market_details.get(market_id)
+        tokens = self._market_tokens.get(position.get('market_id'))
+        if tokens is None:
+            return None, None
 
-        if not market or 'tokens' not in market:
+        yes_book = self.order_books.get(tokens[0])
+        no_book = self.order_books.get(tokens[1])
+        if not yes_book or not no_book or not yes_book['bids'] or not no_book['bids']:
             return None, None
 
-        yes_token = market['tokens'][0]['token_id']
-        no_token = market['tokens'][1]['token_id']
+        return float(yes_book['bids'][0]['price']), float(no_book['bids'][0]['price'])
+
+    def _record_position(self, market_id: str, position: dict):
+        """Append a position and index it by market, dropping the oldest when full."""
+        if len(self.positions) == self.positions.maxlen:
+            oldest = self.positions[0]
+            oldest_market = oldest.get('market_id', oldest.get('market'))
+            siblings = self._positions_by_market.get(oldest_market)
+            if siblings:
+                # By identity: equal-looking positions are distinct trades
+                index = next((i for i, p in enumerate(siblings) if p is oldest), None)
+                if index is not None:
+                    del siblings[index]
+                if not siblings:
+                    del self._positions_by_market[oldest_market]
+            if oldest.get('status') == 'EXECUTED':
+                self._open_positions_count -= 1
+        self.positions.append(position)
+        self._positions_by_market.setdefault(market_id, []).append(position)
+        if position.get('status') == 'EXECUTED':
+            self._open_positions_count += 1
+
+    def _persist_trade(self, trade_record: dict):
+        """
+        Queue a trade for _trade_writer, or save it now if the writer isn't running.
+
+        The writer stores the new row id on the record (trade_record['id']),
+        and re-applies the status of a position that was closed while its
+        row was being written.
+        """
+        if self._trade_writer_task is not None and not self._trade_writer_task.done():
+            try:
+                self._trade_write_queue.put_nowait(trade_record)
+                return
+            except asyncio.QueueFull:
+                logger.warning("Trade write queue full, saving inline")
+        try:
+            trade_record['id'] = self.trade_storage.save_trade(trade_record)  # Store ID for status updates
+            logger.debug(f"Trade saved to database with ID: {trade_record['id']}")
+        except Exception as e:
+            logger.error(f"Failed to save trade to database: {e}")
+
+    async def _trade_writer(self):
+        """Save queued trades in batches until a None sentinel is received."""
+        queue = self._trade_write_queue
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not (stopping and queue.empty()):
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            if None in batch:
+                stopping = True
+                batch = [trade_record for trade_record in batch if trade_record is not None]
+            if not batch:
+                continue
+
+            # Write copies, so the status stored for each row is the one
+            # captured here rather than whatever the thread happens to read
+            rows = [dict(trade_record) for trade_record in batch]
+            trade_ids = await loop.run_in_executor(None, self._save_trade_rows, rows)
+
+            changed = []
+            for trade_record, row, trade_id in zip(batch, rows, trade_ids):
+                if trade_id is None:
+                    continue
+                trade_record['id'] = trade_id  # Store ID for status updates
+                status = trade_record.get('status', 'EXECUTED')
+                if status != row.get('status', 'EXECUTED'):
+                    # Closed during the write, when there was no id to update
+                    changed.append((trade_id, status))
+            logger.debug(f"Saved {len(batch)} trade(s) to database")
+
+            for trade_id, status in changed:
+                try:
+                    await loop.run_in_executor(
+                        None, self.trade_storage.update_trade_status, trade_id, status
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to update status of trade {trade_id}: {e}")
 
-        yes_bids = self.order_books.get(yes_token, {}).get('bids', [])
-        no_bids = self.order_books.get(no_token, {}).get('bids', [])
+    def _save_trade_rows(self, rows: List[dict]) -> List[Optional[int]]:
+        """
+        Blocking part of _trade_writer: save rows in one transaction.
 
-        if not yes_bids or not no_bids:
-            return None, None
+        A failed transaction stores nothing, so the rows are then retried one
+        by one; only those that fail on their own are lost (id None).
+        """
+        try:
+            return self.trade_storage.save_trades(rows)
+        except Exception as e:
+            logger.error(f"Failed to save {len(rows)} trade(s) in one batch, retrying one by one: {e}")
 
-        return float(yes_bids[0]['price']), float(no_bids[0]['price'])
+        trade_ids = []
+        for row in rows:
+            try:
+                trade_ids.append(self.trade_storage.save_trade(row))
+            except Exception as e:
+                logger.error(f"Failed to save trade for {row.get('market_id')} to database: {e}")
+                trade_ids.append(None)
+        return trade_ids
+
+    async def _stop_trade_writer(self):
+        """Flush queued trades, then make sure the writer task is gone."""
+        task = self._trade_writer_task
+        if task is None:
+            return
+        self._trade_writer_task = None  # later trades are saved inline
+        try:
+            if not task.done():
+                await self._trade_write_queue.put(None)
+                await task
+        finally:
+            task.cancel()
+
+    def _mark_position_closed(self, position: dict):
+        """Set a position to CLOSED, keeping the open-position count in step."""
+        if position.get('status') == 'EXECUTED':
+            # Positions that already dropped off the deque were uncounted then
+            siblings = self._positions_by_market.get(position.get('market_id'), ())
+            if any(p is position for p in siblings):
+                self._open_positions_count -= 1
+        position['status'] = 'CLOSED'
+
+    def get_positions_for_market(self, market_id: str) -> List[dict]:
+        """Positions recorded for one market, oldest first."""
+        return self._positions_by_market.get(market_id, [])
 
     async def manual_exit_position(self, position_id: str) -> bool:
         """
@@ -558,8 +1016,9 @@ class ArbitrageBot:
             # We fetch markets with volume > configured
             # Using next_cursor logic if needed, simplified here to get top 100 relevant
             markets = await loop.run_in_executor(
-                None,
-                lambda: self.client.get_markets(
+                self._clob_pool,
+                functools.partial(
+                    self.client.get_markets,
                     limit=50,
                     active=True,
                     volume_min=self.config.MIN_MARKET_VOLUME
@@ -573,19 +1032,74 @@ class ArbitrageBot:
             for m in markets:
                 # Basic filter: 2 tokens (Binary)
                 if len(m.get('tokens', [])) == 2:
-                    condition_id = m['condition_id']
+                    # Interned: this id keys the cooldown, lock, opportunity
+                    # and momentum dicts on every check
+                    condition_id = m['condition_id'] = sys.intern(m['condition_id'])
                     self.markets_whitelist.append(condition_id)
                     self.market_details[condition_id] = m
 
-                    # Build token to market index for fast O(1) lookup
+                    # Interned ids let every later dict hit compare by identity
                     for token in m['tokens']:
-                        self.token_to_market[token['token_id']] = condition_id
+                        token['token_id'] = sys.intern(token['token_id'])
+                    self._index_market(condition_id, m)
 
             logger.info(f"Monitoring {len(self.markets_whitelist)} markets with significant volume.")
+
+            # Resolve per-token order metadata now rather than on the first
+            # order; tokens warmed on an earlier fetch are already cached
+            cold_tokens = [t for t in self.token_to_market if t not in self._warmed_tokens]
+            if not self.is_paper_mode and cold_tokens:
+                if self._order_warmup_task and not self._order_warmup_task.done():
+                    self._order_warmup_task.cancel()
+                self._order_warmup_task = asyncio.create_task(
+                    self._warm_order_metadata(cold_tokens)
+                )
             
         except Exception as e:
             logger.error(f"Error fetching markets: {e}")
 
+    def _index_market(self, condition_id: str, m: dict):
+        """
+        Build the token indexes for fast O(1) lookup of a binary market.
+
+        token_dispatch resolves a token straight to its market and both
+        outcome tokens, so check_arbitrage needs a single dict hit per tick.
+        """
+        yes_token = m['tokens'][0]['token_id']
+        no_token = m['tokens'][1]['token_id']
+        dispatch = (condition_id, yes_token, no_token)
+        self._market_tokens[condition_id] = (yes_token, no_token)
+        for token in m['tokens']:
+            self.token_to_market[token['token_id']] = condition_id
+            self.token_dispatch[token['token_id']] = dispatch
+
+    async def _warm_order_metadata(self, token_ids: List[str]):
+        """
+        Fill the CLOB client's per-token caches in the background.
+
+        create_order looks up tick size, neg-risk flag and fee rate for the
+        token, each an HTTP round trip the first time it is seen. Doing it
+        ahead of time keeps those round trips out of the execution window.
+        """
+        loop = asyncio.get_running_loop()
+        for token_id in token_ids:
+            if self.client is None:
+                return
+            # One slot per GET, so warm-up stays within the configured rate
+            await self.rate_limiter.acquire_n('default', ORDER_METADATA_REQUESTS)
+            try:
+                await loop.run_in_executor(self._clob_pool, self._load_order_metadata, token_id)
+            except Exception as e:
+                logger.debug(f"Order metadata warm-up failed for {token_id}: {e}")
+            else:
+                self._warmed_tokens.add(token_id)
+
+    def _load_order_metadata(self, token_id: str):
+        """Blocking part of _warm_order_metadata (results are cached by the client)."""
+        self.client.get_tick_size(token_id)
+        self.client.get_neg_risk(token_id)
+        self.client.get_fee_rate_bps(token_id)
+
     async def connect_and_listen(self):
         """
         Main WebSocket Loop
@@ -627,8 +1141,13 @@ class ArbitrageBot:
             # Limit subscription to avoid 429 or overflow 
             token_ids = token_ids[:self.config.MAX_TOKENS_MONITOR]  # Limit tokens for reliability
             
-            for tid in token_ids:
-                msg = {"type": "subscribe", "channel": "level2", "token_id": tid}
+            # One subscribe frame per chunk of assets instead of one per token
+            for start in range(0, len(token_ids), WS_SUBSCRIBE_CHUNK):
+                msg = {
+                    "type": "subscribe",
+                    "channel": "level2",
+                    "assets_ids": token_ids[start:start + WS_SUBSCRIBE_CHUNK]
+                }
                 await ws.send(json.dumps(msg))
             
             logger.info(f"Subscribed to price feeds for {len(token_ids)} tokens.")
@@ -636,8 +1155,37 @@ class ArbitrageBot:
             while self.running:
                 try:
                     msg = await ws.recv()
-                    data = json.loads(msg)
-                    await self.process_message(data)
+                    batch: Dict[str, dict] = {}
+                    _merge_ws_message(batch, msg)
+
+                    # Drain what is already queued, so a burst of updates to
+                    # one token triggers a single arbitrage check
+                    for _ in range(WS_MAX_BATCH - 1):
+                        try:
+                            msg = await asyncio.wait_for(ws.recv(), WS_DRAIN_TIMEOUT)
+                        except asyncio.TimeoutError:
+                            break
+                        _merge_ws_message(batch, msg)
+
+                    # Apply every update first, then check each touched
+                    # market once: both of its books are current by then.
+                    # Errors are contained per token so one bad update
+                    # doesn't discard the rest of the batch.
+                    to_check: Dict[str, str] = {}  # market_id -> token_id
+                    for data in batch.values():
+                        try:
+                            tid = self._apply_book_update(data)
+                        except Exception as e:
+                            logger.error(f"Skipping book update for {data.get('token_id')}: {e}")
+                            continue
+                        dispatch = self.token_dispatch.get(tid)
+                        if dispatch is not None:
+                            to_check[dispatch[0]] = tid
+                    for tid in to_check.values():
+                        try:
+                            await self.check_arbitrage(tid)
+                        except Exception as e:
+                            logger.error(f"Arbitrage check failed for {tid}: {e}")
                 except websockets.exceptions.ConnectionClosed:
                     logger.error("WebSocket connection closed. Reconnecting...")
                     break
@@ -645,9 +1193,16 @@ class ArbitrageBot:
                     logger.error(f"WS Error: {e}")
                     await asyncio.sleep(1)
 
-    async def process_message(self, data: dict):
+    def _get_prepared_asks(self, token_id: str) -> BookSide:
+        """Ask side of a token as parsed by _apply_book_update (empty if unseen)."""
+        return self._asks_by_token.get(token_id, _EMPTY_SIDE)
+
+    def _apply_book_update(self, data: dict) -> Optional[str]:
         """
-        Updates local orderbook and triggers check
+        Updates local orderbook from one WS message.
+
+        Returns the (interned) token_id updated, or None if the message
+        carried no book data.
         """
         # Parse Level 2 updates
         # Structure: { "token_id": "...", "bids": [...], "asks": [...] }
@@ -658,7 +1213,8 @@ class ArbitrageBot:
         # Check event type?
         # Assuming typical message structure
         if 'token_id' in data:
-            tid = data['token_id']
+            # Same object as the key stored by fetch_markets (see sys.intern there)
+            tid = data['token_id'] = sys.intern(data['token_id'])
             # naive update
             if tid not in self.order_books:
                 self.order_books[tid] = {'bids': [], 'asks': []}
@@ -666,14 +1222,19 @@ class ArbitrageBot:
             # Apply updates (simplified: Replace logic if snapshot, merge if update)
             # For this exercise, we treat incoming as latest snapshot if full book sent
             if 'asks' in data:
+                # Parse once per update; capped at the depth detection analyses.
+                # The raw list stays for position monitor / data collector.
+                # Parsed first, so a malformed book leaves both views untouched.
+                previous = self._asks_by_token.get(tid, _EMPTY_SIDE)
+                self._asks_by_token[tid] = BookSide.from_levels(
+                    data['asks'],
+                    version=previous.version + 1,
+                    max_depth=self.config.MAX_ORDER_BOOK_DEPTH
+                )
                 self.order_books[tid]['asks'] = data['asks']
             if 'bids' in data:
                 self.order_books[tid]['bids'] = data['bids']
 
-            # Update position monitor with latest order book and positions
-            self.position_monitor.update_order_books(self.order_books)
-            self.position_monitor.update_positions(self.positions)
-
             # PHASE 4: Capture order book snapshot for backtesting
             if self.data_collector and self.data_collector.is_running:
                 market_id = self.token_to_market.get(tid)
@@ -684,9 +1245,8 @@ class ArbitrageBot:
                         order_book=self.order_books[tid]
                     )
 
-            # Find which market this token belongs to
-            # Then check Arb for that market
-            await self.check_arbitrage(tid)
+            return tid
+        return None
 
     async def check_arbitrage(self, token_id: str):
         """
@@ -707,83 +1267,89 @@ class ArbitrageBot:
             logger.warning("Daily loss limit reached via CapitalAllocator")
             return
 
-        # Fast O(1) lookup using token_to_market index
-        market_id = self.token_to_market.get(token_id)
-        if not market_id:
-            return
-
-        m = self.market_details.get(market_id)
-        if not m or 'tokens' not in m or len(m['tokens']) < 2:
+        # Fast O(1) lookup: token -> (market, YES token, NO token)
+        dispatch = self.token_dispatch.get(token_id)
+        if dispatch is None:
             return
-
-        yes_token = m['tokens'][0]['token_id']
-        no_token = m['tokens'][1]['token_id']
+        market_id, yes_token, no_token = dispatch
 
         # Get order book depth (not just best price)
-        ask_yes_list = self.order_books.get(yes_token, {}).get('asks', [])
-        ask_no_list = self.order_books.get(no_token, {}).get('asks', [])
+        # PHASE 5: Prepared books are already limited to MAX_ORDER_BOOK_DEPTH
+        yes_side = self._get_prepared_asks(yes_token)
+        no_side = self._get_prepared_asks(no_token)
 
-        if not ask_yes_list or not ask_no_list:
+        if not yes_side.prices or not no_side.prices:
             return
 
-        # PHASE 5: Limit order book depth to MAX_ORDER_BOOK_DEPTH
-        ask_yes_list = ask_yes_list[:self.config.MAX_ORDER_BOOK_DEPTH]
-        ask_no_list = ask_no_list[:self.config.MAX_ORDER_BOOK_DEPTH]
+        # Neither book changed since this market was last rejected on price
+        book_versions = (yes_side.version, no_side.version)
+        if self._rejected_versions.get(market_id) == book_versions:
+            return
 
-        # PHASE 5: Apply trading fees to target cost
-        # Fee is applied twice (once for YES, once for NO)
-        fee_multiplier = 1.0 + (self.config.TRADING_FEE_PERCENT * 2)
-        base_target_cost = 1.0 - self.config.MIN_PROFIT_MARGIN
-        target_cost_with_fees = base_target_cost / fee_multiplier
+        # PHASE 5: Fee-adjusted targets (constant, computed in __init__)
+        fee_multiplier = self._fee_multiplier
+        base_target_cost = self._target_cost
+        target_cost_with_fees = self._target_cost_with_fees
 
-        # Calculate max shares we might want based on capital
-        max_possible_shares = self.config.CAPITAL_PER_TRADE / 0.5  # Rough estimate
+        # Most updates are not arbitrageable: if even the best asks are too
+        # expensive, deeper levels only cost more, so skip the depth search
+        if yes_side.prices[0] + no_side.prices[0] >= target_cost_with_fees:
+            self._rejected_versions[market_id] = book_versions
+            return
 
         optimal_shares, eff_yes, eff_no = MarketImpactCalculator.find_optimal_trade_size(
-            ask_yes_list,
-            ask_no_list,
+            yes_side,
+            no_side,
             max_combined_cost=target_cost_with_fees,
-            max_shares=max_possible_shares,
+            max_shares=self._max_possible_shares,
             precision=1.0
         )
 
         if optimal_shares <= 0:
+            self._rejected_versions[market_id] = book_versions
             return  # No profitable opportunity at any size
 
         effective_cost = eff_yes + eff_no
         effective_cost_with_fees = effective_cost * fee_multiplier
 
         if effective_cost_with_fees >= base_target_cost:
+            self._rejected_versions[market_id] = book_versions
             return  # Not profitable after fees
 
         # PHASE 5: Check minimum profit in dollars
         expected_profit = optimal_shares * (1.0 - effective_cost_with_fees)
         if expected_profit < self.config.MIN_PROFIT_DOLLARS:
             logger.debug(
-                f"Profit too low: ${expected_profit:.2f} < ${self.config.MIN_PROFIT_DOLLARS:.2f}"
+                "Profit too low: $%.2f < $%.2f",
+                expected_profit, self.config.MIN_PROFIT_DOLLARS
             )
+            self._rejected_versions[market_id] = book_versions
             return
 
+        self._rejected_versions.pop(market_id, None)
+
         roi = (1.0 - effective_cost_with_fees) / effective_cost_with_fees * 100
 
         # PHASE 5: Check position limits before continuing
-        open_positions = len([p for p in self.positions if p.get('status') == 'EXECUTED'])
+        open_positions = self._open_positions_count
         if open_positions >= self.config.MAX_CONCURRENT_POSITIONS:
             logger.debug(
-                f"Position limit: {open_positions}/{self.config.MAX_CONCURRENT_POSITIONS}"
+                "Position limit: %d/%d",
+                open_positions, self.config.MAX_CONCURRENT_POSITIONS
             )
             return
 
+        # Single clock read shared by the cache, time pattern and cooldown checks below
+        now = time.monotonic()
+
         # PHASE 5: Time-based trading check
-        time_summary = TimePatternAnalyzer.get_trading_summary()
-        min_quality = TimePatternAnalyzer.get_min_quality_score(
-            self.config.MIN_MARKET_QUALITY_SCORE
-        )
+        period, time_multiplier = self._get_time_context(now)
 
         # Update opportunity cache with EFFECTIVE prices (not top-of-book)
         opportunity = self.opportunity_manager.update(
             market_id, yes_token, no_token, eff_yes, eff_no,
-            market_score=0.0  # Market score will be updated by MarketScorer if available
+            market_score=0.0,  # Market score will be updated by MarketScorer if available
+            now=now
         )
 
         # PHASE 4: Log opportunity for backtesting analysis
@@ -797,15 +1363,15 @@ class ArbitrageBot:
             )
 
         # Log with depth-aware info and fees
-        top_yes = float(ask_yes_list[0]['price'])
-        top_no = float(ask_no_list[0]['price'])
+        top_yes = yes_side.prices[0]
+        top_no = no_side.prices[0]
         logger.info(
             f"DEPTH-AWARE ARB: {market_id} | "
             f"Top: {top_yes:.3f}+{top_no:.3f}={top_yes+top_no:.3f} | "
             f"Effective: {eff_yes:.4f}+{eff_no:.4f}={effective_cost:.4f} | "
             f"WithFees: {effective_cost_with_fees:.4f} | "
             f"Shares: {optimal_shares:.1f} | ROI: {roi:.2f}% | "
-            f"Profit: ${expected_profit:.2f} | Period: {time_summary['period']}"
+            f"Profit: ${expected_profit:.2f} | Period: {period}"
         )
 
         # Notify UI with effective prices
@@ -815,44 +1381,57 @@ class ArbitrageBot:
             except Exception as e:
                 logger.error(f"UI Callback Error: {e}")
 
-        # OPTIMIZATION: Check cooldown before execution
-        if not self.cooldown_manager.can_trade(market_id):
-            remaining = self.cooldown_manager.time_remaining(market_id)
-            logger.debug(f"Market {market_id} in cooldown ({remaining:.1f}s remaining)")
+        # OPTIMIZATION: Check cooldown and in-flight execution in one lookup
+        executing, remaining = self.market_gate.status(market_id, now)
+        if remaining > 0:
+            logger.debug("Market %s in cooldown (%.1fs remaining)", market_id, remaining)
             return
 
-        # OPTIMIZATION: Check if already executing
-        if self.execution_lock.is_executing(market_id):
-            logger.debug(f"Market {market_id} already executing")
+        if executing:
+            logger.debug("Market %s already executing", market_id)
             return
 
         # Execute with depth-aware parameters and momentum priority
         priority = self.opportunity_manager.get_priority_score(market_id)
         momentum = opportunity.momentum if opportunity else "NEW"
 
-        logger.debug(f"Executing {market_id} with priority {priority:.2f} (momentum: {momentum})")
+        logger.debug("Executing %s with priority %.2f (momentum: %s)", market_id, priority, momentum)
 
         await self.execute_depth_aware_trade(
             market_id, yes_token, no_token, optimal_shares, eff_yes, eff_no,
-            roi_percent=roi, time_multiplier=TimePatternAnalyzer.get_time_multiplier()
+            roi_percent=roi, time_multiplier=time_multiplier
         )
 
+    def _get_time_context(self, now: float) -> Tuple[str, float]:
+        """
+        Current trading period and time multiplier, refreshed every TIME_PATTERN_TTL.
+
+        Both only change on hour boundaries, so there is no need to read the
+        wall clock and rebuild them for every opportunity.
+        """
+        expires_at, period, multiplier = self._time_context
+        if now >= expires_at:
+            period = TimePatternAnalyzer.get_current_period()
+            multiplier = TimePatternAnalyzer.get_time_multiplier()
+            self._time_context = (now + TIME_PATTERN_TTL, period, multiplier)
+        return period, multiplier
+
     async def execute_with_slippage_check(self, market_id: str, yes_token: str, no_token: str,
                                            expected_yes: float, expected_no: float) -> bool:
         """
         Execute trade with slippage protection.
         Verifies current prices haven't moved significantly before executing.
         """
-        # Get current prices from order books
-        ask_yes_list = self.order_books.get(yes_token, {}).get('asks', [])
-        ask_no_list = self.order_books.get(no_token, {}).get('asks', [])
+        # Get current prices from the prepared order books
+        yes_prices = self._get_prepared_asks(yes_token).prices
+        no_prices = self._get_prepared_asks(no_token).prices
 
-        if not ask_yes_list or not ask_no_list:
+        if not yes_prices or not no_prices:
             logger.warning(f"Order books empty for {market_id}")
             return False
 
-        current_yes = float(ask_yes_list[0].get('price', 0))
-        current_no = float(ask_no_list[0].get('price', 0))
+        current_yes = yes_prices[0]
+        current_no = no_prices[0]
 
         expected_cost = expected_yes + expected_no
         current_cost = current_yes + current_no
@@ -897,12 +1476,13 @@ class ArbitrageBot:
         Returns:
             True if trade executed successfully, False otherwise
         """
-        if not await self.execution_lock.acquire(market_id):
+        if not self.market_gate.try_enter(market_id):
             logger.warning(f"Could not acquire lock for {market_id}")
             return False
 
+        traded = False
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
 
             # PHASE 5: Calculate dynamic allocation based on opportunity quality
             allocation_result = self.capital_allocator.calculate_allocation(
@@ -923,13 +1503,13 @@ class ArbitrageBot:
                 shares = round(shares, 2)
 
             logger.debug(
-                f"Allocation: ${allocation_result.allocated_capital:.2f} -> "
-                f"{shares:.2f} shares ({allocation_result.reason})"
+                "Allocation: $%.2f -> %.2f shares (%s)",
+                allocation_result.allocated_capital, shares, allocation_result.reason
             )
 
             # Re-verify liquidity before execution (do this BEFORE balance check)
-            ask_yes = self.order_books.get(yes_token, {}).get('asks', [])
-            ask_no = self.order_books.get(no_token, {}).get('asks', [])
+            ask_yes = self._get_prepared_asks(yes_token)
+            ask_no = self._get_prepared_asks(no_token)
 
             yes_result = MarketImpactCalculator.calculate_effective_cost(ask_yes, shares)
             no_result = MarketImpactCalculator.calculate_effective_cost(ask_no, shares)
@@ -949,11 +1529,24 @@ class ArbitrageBot:
                 logger.warning(f"Balance check failed: {message}")
                 return False
 
+            # Only redo the depth walk if a book changed while awaiting the
+            # balance check; otherwise the results above are still exact
+            latest_yes = self._get_prepared_asks(yes_token)
+            latest_no = self._get_prepared_asks(no_token)
+            if latest_yes.version != ask_yes.version or latest_no.version != ask_no.version:
+                ask_yes, ask_no = latest_yes, latest_no
+                yes_result = MarketImpactCalculator.calculate_effective_cost(ask_yes, shares)
+                no_result = MarketImpactCalculator.calculate_effective_cost(ask_no, shares)
+
+                if not yes_result.has_sufficient_liquidity or not no_result.has_sufficient_liquidity:
+                    logger.warning(f"Liquidity disappeared for {market_id}")
+                    return False
+
             current_cost = yes_result.effective_price + no_result.effective_price
 
             # PHASE 5: Apply fees to profitability check
-            fee_multiplier = 1.0 + (self.config.TRADING_FEE_PERCENT * 2)
-            target_cost = 1.0 - self.config.MIN_PROFIT_MARGIN
+            fee_multiplier = self._fee_multiplier
+            target_cost = self._target_cost
 
             if current_cost * fee_multiplier >= target_cost:
                 logger.warning(
@@ -963,7 +1556,7 @@ class ArbitrageBot:
                 return False
 
             # Check execution window
-            if time.time() - start_time > MAX_EXECUTION_WINDOW:
+            if time.monotonic() - start_time > MAX_EXECUTION_WINDOW:
                 logger.error("Execution window exceeded. Aborting.")
                 return False
 
@@ -991,25 +1584,15 @@ class ArbitrageBot:
                 if not success:
                     logger.warning(f"[PAPER] Trade simulation failed: {result.get('reason')}")
             else:
-                # LIVE MODE: Execute real orders
-                loop = asyncio.get_running_loop()
-
-                # PHASE 2: Rate limit order API calls (acquire 2 slots for parallel orders)
-                await self.rate_limiter.acquire('orders')
-                await self.rate_limiter.acquire('orders')
-
-                # Execute both orders in parallel with effective prices
-                t1 = loop.run_in_executor(
-                    None,
-                    lambda: self._place_order(yes_token, shares, yes_result.effective_price)
+                # LIVE MODE: Execute real orders (both legs in one request)
+                yes_ok, no_ok, results = await self._submit_order_pair(
+                    yes_token, no_token, shares,
+                    yes_result.effective_price, no_result.effective_price
                 )
-                t2 = loop.run_in_executor(
-                    None,
-                    lambda: self._place_order(no_token, shares, no_result.effective_price)
-                )
-
-                results = await asyncio.gather(t1, t2, return_exceptions=True)
-                success = all(not isinstance(r, Exception) and r is not None for r in results)
+                success = yes_ok and no_ok
+                # A lone filled leg is being sold back: cool the market down
+                # so the next tick can't re-enter before the unwind lands
+                traded = yes_ok or no_ok
 
             if success:
                 profit = shares * (1.0 - current_cost)
@@ -1034,15 +1617,10 @@ class ArbitrageBot:
                     "levels_no": no_result.levels_consumed
                 }
 
-                self.positions.append(trade_record)
+                self._record_position(market_id, trade_record)
 
                 # PHASE 2: Persist trade to database
-                try:
-                    trade_id = self.trade_storage.save_trade(trade_record)
-                    trade_record['id'] = trade_id  # Store ID for status updates
-                    logger.debug(f"Trade saved to database with ID: {trade_id}")
-                except Exception as e:
-                    logger.error(f"Failed to save trade to database: {e}")
+                self._persist_trade(trade_record)
 
                 # PHASE 2: Record P&L for daily tracking
                 self.risk_manager.record_pnl(profit)
@@ -1060,7 +1638,7 @@ class ArbitrageBot:
                     except Exception as e:
                         logger.error(f"Trade callback error: {e}")
 
-                self.cooldown_manager.record_trade(market_id)
+                traded = True  # starts the cooldown on release
                 self.opportunity_manager.mark_executed(market_id)
                 return True
             else:
@@ -1072,20 +1650,20 @@ class ArbitrageBot:
                 return False
 
         finally:
-            await self.execution_lock.release(market_id)
+            self.market_gate.exit(market_id, traded=traded)
 
     async def execute_trade(self, market_id, yes_token, no_token, price_yes, price_no) -> bool:
         """
         Executes the dual buy order with execution lock.
         Returns True if successful, False otherwise.
         """
-        # OPTIMIZATION: Acquire execution lock
-        if not await self.execution_lock.acquire(market_id):
+        # OPTIMIZATION: Acquire execution lock (also refuses markets in cooldown)
+        if not self.market_gate.try_enter(market_id):
             logger.warning(f"Could not acquire lock for {market_id}")
             return False
 
+        traded = False
         try:
-            start_time = time.time()
             logger.info(f"Executing Trade for {market_id}")
 
             # Calculate size
@@ -1097,32 +1675,22 @@ class ArbitrageBot:
             if shares <= 0:
                 return False
 
-            # 20s Window Constraint
-            if time.time() - start_time > MAX_EXECUTION_WINDOW:
-                logger.error("Execution window exceeded. Aborting.")
-                return False
-
             logger.info(f"Buying {shares} shares of YES and NO.")
 
-            loop = asyncio.get_running_loop()
-
-            # PHASE 2: Rate limit order API calls
-            await self.rate_limiter.acquire('orders')
-            await self.rate_limiter.acquire('orders')
-
-            # Execute both orders in parallel
-            t1 = loop.run_in_executor(None, lambda: self._place_order(yes_token, shares, price_yes))
-            t2 = loop.run_in_executor(None, lambda: self._place_order(no_token, shares, price_no))
-
-            results = await asyncio.gather(t1, t2, return_exceptions=True)
-
-            success = all(not isinstance(r, Exception) and r is not None for r in results)
-            if success:
+            # Execute both orders in one request
+            yes_ok, no_ok, results = await self._submit_order_pair(
+                yes_token, no_token, shares, price_yes, price_no
+            )
+            # A lone filled leg is being sold back; keep the market cooling down
+            traded = yes_ok or no_ok
+            if yes_ok and no_ok:
                 logger.info("Trade Executed Successfully.")
-                self.positions.append({"market": market_id, "size": shares, "entry": cost, "time": time.time()})
+                self._record_position(
+                    market_id, {"market": market_id, "size": shares, "entry": cost, "time": time.time()}
+                )
 
                 # OPTIMIZATION: Record trade for cooldown and mark opportunity as executed
-                self.cooldown_manager.record_trade(market_id)
+                traded = True
                 self.opportunity_manager.mark_executed(market_id)
                 return True
             else:
@@ -1131,29 +1699,90 @@ class ArbitrageBot:
                 return False
 
         finally:
-            # OPTIMIZATION: Always release lock
-            await self.execution_lock.release(market_id)
+            # OPTIMIZATION: Always release lock; a successful trade starts the cooldown
+            self.market_gate.exit(market_id, traded=traded)
+
+    async def _submit_order_pair(self, yes_token: str, no_token: str, shares: float,
+                                 price_yes: float, price_no: float) -> Tuple[bool, bool, list]:
+        """
+        Submit the YES and NO legs together through _place_order_batch.
+
+        One rate-limit slot and one executor hop cover both legs, and the
+        CLOB receives them in the same request, which narrows the window
+        where only one leg is live. If exactly one leg still fills, it is
+        sold back in the background (_schedule_unwind).
+
+        Returns:
+            Tuple of (YES filled, NO filled, per-leg results or the raised exception)
+        """
+        # PHASE 2: Rate limit order API calls (one request carries both legs)
+        await self.rate_limiter.acquire('orders')
 
-    def _place_order(self, token_id, amount, price):
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._order_pool,
+                self._place_order_batch,
+                [(yes_token, shares, price_yes), (no_token, shares, price_no)]
+            )
+        except Exception as e:
+            return False, False, [e]
+
+        if not isinstance(results, list) or len(results) != 2:
+            return False, False, results
+
+        yes_res, no_res = results
+        # A leg only counts as filled when the CLOB says so explicitly
+        yes_ok = isinstance(yes_res, dict) and yes_res.get('success') is True
+        no_ok = isinstance(no_res, dict) and no_res.get('success') is True
+        if yes_ok != no_ok:
+            # One FOK leg filled without its hedge: sell it back right away
+            # rather than hold a naked position until someone notices
+            filled_side, filled_token = ('YES', yes_token) if yes_ok else ('NO', no_token)
+            logger.critical(
+                f"Only the {filled_side} leg filled ({filled_token}); unwinding {shares} shares"
+            )
+            self._schedule_unwind(filled_token, shares)
+        return yes_ok, no_ok, results
+
+    def _schedule_unwind(self, token_id: str, shares: float):
+        """Start selling back an unhedged leg at the current best bid."""
+        book = self.order_books.get(token_id)
+        if not book or not book['bids']:
+            logger.critical(f"No bids to unwind {token_id}. Close the position manually!")
+            return
+        price = float(book['bids'][0]['price'])
+        task = asyncio.create_task(self.exit_executor.unwind_leg(token_id, shares, price))
+        # Hold a reference until it finishes so the task isn't collected
+        self._unwind_tasks.add(task)
+        task.add_done_callback(self._unwind_tasks.discard)
+
+    def _place_order_batch(self, orders: List[Tuple[str, float, float]]):
+        """
+        Sign every leg locally, then post them all in a single POST /orders.
+
+        Args:
+            orders: (token_id, amount, price) for each leg
+
+        Returns:
+            The CLOB response, one entry per order in submission order
+        """
         if self.client is None:
             raise RuntimeError("Client not initialized - cannot place order")
         try:
-            # Create Order
-            # Using FOK (Fill or Kill) or IOC to avoid partial fills creating unhedged risk
-            # For Arb, FillOrKill is safest.
-            # However, Limit orders are standard.
-            resp = self.client.create_and_post_order(
-                OrderArgs(
-                    price=price,
-                    size=amount,
-                    side=BUY,
-                    token_id=token_id,
-                    order_type=OrderType.FOK 
+            # Fill or Kill on every leg so a partial fill cannot leave us unhedged
+            signed = [
+                PostOrdersArgs(
+                    order=self.client.create_order(
+                        OrderArgs(price=price, size=amount, side=BUY, token_id=token_id)
+                    ),
+                    orderType=OrderType.FOK
                 )
-            )
-            return resp
+                for token_id, amount, price in orders
+            ]
+            return self.client.post_orders(signed)
         except Exception as e:
-            logger.error(f"Order Failed: {e}")
+            logger.error(f"Batch Order Failed: {e}")
             raise e
 
     async def run(self):
@@ -1165,54 +1794,72 @@ class ArbitrageBot:
         logger.info("Starting Arbitrage Engine...")
         await self.fetch_markets()
 
-        # Start position monitor for stop-loss/take-profit
-        self.position_monitor.update_market_data(self.token_to_market, self.market_details)
-        self.position_monitor.start()
-        logger.info("Position Monitor started")
+        # PHASE 2: Persist trades in the background
+        self._trade_writer_task = asyncio.create_task(self._trade_writer())
 
-        # PHASE 4: Start data collector for backtesting
-        if self.data_collector:
-            self.data_collector.start()
-            logger.info("Data Collector started")
+        # Clean up in finally: the UI cancels this task right after stop()
+        try:
+            # Start position monitor for stop-loss/take-profit
+            self.position_monitor.update_market_data(self.token_to_market, self.market_details)
+            self.position_monitor.start()
+            logger.info("Position Monitor started")
 
-        while self.running:
-            try:
-                await self.connect_and_listen()
+            # PHASE 4: Start data collector for backtesting
+            if self.data_collector:
+                self.data_collector.start()
+                logger.info("Data Collector started")
 
-                # If no markets were found, wait a bit before retrying fetch or connecting
-                if not self.markets_whitelist:
-                    await asyncio.sleep(10)
-                    await self.fetch_markets()
+            while self.running:
+                try:
+                    await self.connect_and_listen()
 
-                # If connect_and_listen returns normally, reset attempts
-                self.reconnect_attempts = 0
+                    # If no markets were found, wait a bit before retrying fetch or connecting
+                    if not self.markets_whitelist:
+                        await asyncio.sleep(10)
+                        await self.fetch_markets()
 
-            except websockets.exceptions.ConnectionClosed as e:
-                await self._handle_reconnection(f"Connection closed: {e}")
+                    # If connect_and_listen returns normally, reset attempts
+                    self.reconnect_attempts = 0
 
-            except websockets.exceptions.InvalidStatusCode as e:
-                await self._handle_reconnection(f"Invalid status code: {e}")
+                except websockets.exceptions.ConnectionClosed as e:
+                    await self._handle_reconnection(f"Connection closed: {e}")
 
-            except ConnectionRefusedError as e:
-                await self._handle_reconnection(f"Connection refused: {e}")
+                except websockets.exceptions.InvalidStatusCode as e:
+                    await self._handle_reconnection(f"Invalid status code: {e}")
 
-            except Exception as e:
-                logger.error(f"Unexpected error in main loop: {e}")
-                await self._handle_reconnection(str(e))
+                except ConnectionRefusedError as e:
+                    await self._handle_reconnection(f"Connection refused: {e}")
 
-        # Stop position monitor
-        self.position_monitor.stop()
+                except Exception as e:
+                    logger.error(f"Unexpected error in main loop: {e}")
+                    await self._handle_reconnection(str(e))
 
-        # PHASE 4: Stop data collector
-        if self.data_collector:
-            await self.data_collector.stop()
-            logger.info(f"Data Collector stopped. Stats: {self.data_collector.get_stats()}")
+        finally:
+            # Stop position monitor
+            self.position_monitor.stop()
 
-        logger.info("Arbitrage Engine stopped.")
+            # Stop warming order metadata; it would keep spending rate limit
+            if self._order_warmup_task is not None:
+                self._order_warmup_task.cancel()
+                self._order_warmup_task = None
+
+            # Flush trades still waiting to be saved
+            await self._stop_trade_writer()
+
+            # Release the worker threads; orders already queued still go out
+            self._order_pool.shutdown(wait=False)
+            self._clob_pool.shutdown(wait=False)
+
+            # PHASE 4: Stop data collector
+            if self.data_collector:
+                await self.data_collector.stop()
+                logger.info(f"Data Collector stopped. Stats: {self.data_collector.get_stats()}")
+
+            logger.info("Arbitrage Engine stopped.")
 
     async def _handle_reconnection(self, error_msg: str):
         """
-        Handle WebSocket reconnection with exponential backoff.
+        Handle WebSocket reconnection with jittered exponential backoff.
         """
         self.reconnect_attempts += 1
 
@@ -1224,23 +1871,29 @@ class ArbitrageBot:
             self.running = False
             return
 
-        # Exponential backoff with cap
-        delay = min(
-            self.base_reconnect_delay * (2 ** (self.reconnect_attempts - 1)),
-            self.max_reconnect_delay
-        )
+        # Exponential backoff with cap (precomputed in __init__), jittered
+        # into the upper half so instances that dropped together don't all
+        # reconnect in the same instant
+        cap = self._backoff_delays[self.reconnect_attempts - 1]
+        delay = random.uniform(cap * 0.5, cap)
 
         logger.warning(
             f"Connection error: {error_msg}. "
-            f"Reconnecting in {delay}s (attempt {self.reconnect_attempts}/{self.max_reconnect_attempts})"
+            f"Reconnecting in {delay:.1f}s (attempt {self.reconnect_attempts}/{self.max_reconnect_attempts})"
         )
 
-        await asyncio.sleep(delay)
+        # Refresh markets on reconnect (they may have changed); the refresh
+        # doesn't depend on the delay, so run it while we back off
+        logger.info("Refreshing markets before reconnection...")
+        refresh_task = asyncio.create_task(self.fetch_markets())
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            refresh_task.cancel()
+            raise
 
-        # Refresh markets on reconnect (they may have changed)
         try:
-            logger.info("Refreshing markets before reconnection...")
-            await self.fetch_markets()
+            await refresh_task
         except Exception as e:
             logger.error(f"Failed to refresh markets: {e}")
 
@@ -6,6 +6,7 @@ across multiple prediction market platforms (Polymarket, Kalshi).
 """
 
 import asyncio
+import operator
 import time
 import logging
 from dataclasses import dataclass, field
@@ -34,6 +35,8 @@ from backend.services.data_collector import DataCollector
 
 logger = logging.getLogger(__name__)
 
+_ROI_PERCENT_KEY = operator.attrgetter('roi_percent')
+
 
 @dataclass
 class ArbitrageOpportunity:
@@ -480,7 +483,7 @@ class MultiPlatformArbitrageBot:
             all_opportunities.extend(cross_opportunities)
 
         # Sort by ROI descending
-        all_opportunities.sort(key=lambda x: x.roi_percent, reverse=True)
+        all_opportunities.sort(key=_ROI_PERCENT_KEY, reverse=True)
 
         return all_opportunities
 
@@ -197,7 +197,8 @@ class DataCollector:
         """
         Capture an order book snapshot if interval has elapsed.
 
-        Non-blocking - adds to buffer for async flush.
+        Non-blocking - adds the raw book to the buffer; best prices and JSON
+        are computed when the buffer is flushed.
 
         Args:
             token_id: Token identifier
@@ -219,54 +220,15 @@ class DataCollector:
         if not force and (now - last) < self.snapshot_interval_ms:
             return False
 
-        asks = order_book.get('asks', [])
-        bids = order_book.get('bids', [])
-
-        # Calculate best prices
-        best_ask = None
-        best_bid = None
-        spread = None
-
-        if asks:
-            try:
-                first_ask = asks[0]
-                if isinstance(first_ask, dict):
-                    best_ask = float(first_ask.get('price', first_ask))
-                elif isinstance(first_ask, (list, tuple)):
-                    best_ask = float(first_ask[0])
-                else:
-                    best_ask = float(first_ask)
-            except (ValueError, TypeError, IndexError):
-                pass
-
-        if bids:
-            try:
-                first_bid = bids[0]
-                if isinstance(first_bid, dict):
-                    best_bid = float(first_bid.get('price', first_bid))
-                elif isinstance(first_bid, (list, tuple)):
-                    best_bid = float(first_bid[0])
-                else:
-                    best_bid = float(first_bid)
-            except (ValueError, TypeError, IndexError):
-                pass
-
-        if best_ask is not None and best_bid is not None:
-            spread = best_ask - best_bid
-
-        snapshot = Snapshot(
-            timestamp=now,
-            platform=platform,
-            token_id=token_id,
-            market_id=market_id,
-            asks_json=json.dumps(asks),
-            bids_json=json.dumps(bids),
-            best_ask=best_ask,
-            best_bid=best_bid,
-            spread=spread
+        # The book is serialised later, in the flush thread. Callers replace
+        # their level lists on each update instead of mutating them, so the
+        # references stay a consistent snapshot until then.
+        pending = (
+            now, platform, token_id, market_id,
+            order_book.get('asks', []), order_book.get('bids', [])
         )
 
-        self._snapshot_buffer.append(snapshot)
+        self._snapshot_buffer.append(pending)
         self._last_snapshot[cache_key] = now
         self.stats['snapshots_captured'] += 1
 
@@ -352,8 +314,8 @@ class DataCollector:
 
             if batch:
                 loop = asyncio.get_running_loop()
-                await loop.run_in_executor(None, self._write_snapshot_batch, batch)
-                self.stats['snapshots_flushed'] += len(batch)
+                written = await loop.run_in_executor(None, self._write_snapshot_batch, batch)
+                self.stats['snapshots_flushed'] += written
 
         # Flush opportunities
         if self._opportunity_buffer:
@@ -365,19 +327,74 @@ class DataCollector:
                 loop = asyncio.get_running_loop()
                 await loop.run_in_executor(None, self._write_opportunity_batch, opp_batch)
 
-    def _write_snapshot_batch(self, batch: List[Snapshot]):
-        """Synchronous batch write for snapshots (runs in executor)."""
+    @staticmethod
+    def _best_price(levels) -> Optional[float]:
+        """Price of the first level, whatever shape the feed uses (None if unreadable)."""
+        if not levels:
+            return None
+        try:
+            first = levels[0]
+            if isinstance(first, dict):
+                return float(first.get('price', first))
+            elif isinstance(first, (list, tuple)):
+                return float(first[0])
+            else:
+                return float(first)
+        except (ValueError, TypeError, IndexError):
+            return None
+
+    @classmethod
+    def _build_snapshot(cls, pending: tuple) -> Snapshot:
+        """Turn a buffered (timestamp, platform, token, market, asks, bids) capture into a Snapshot."""
+        timestamp, platform, token_id, market_id, asks, bids = pending
+
+        best_ask = cls._best_price(asks)
+        best_bid = cls._best_price(bids)
+        spread = None
+        if best_ask is not None and best_bid is not None:
+            spread = best_ask - best_bid
+
+        return Snapshot(
+            timestamp=timestamp,
+            platform=platform,
+            token_id=token_id,
+            market_id=market_id,
+            asks_json=json.dumps(asks),
+            bids_json=json.dumps(bids),
+            best_ask=best_ask,
+            best_bid=best_bid,
+            spread=spread
+        )
+
+    def _write_snapshot_batch(self, batch: List[tuple]) -> int:
+        """
+        Synchronous batch write for buffered captures (runs in executor).
+
+        Returns:
+            Number of snapshots written; captures whose book is not JSON
+            serialisable are skipped
+        """
+        rows = []
+        for pending in batch:
+            try:
+                s = self._build_snapshot(pending)
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Skipping snapshot for {pending[2]}: {e}")
+                continue
+            rows.append((
+                s.timestamp, s.platform, s.token_id, s.market_id,
+                s.asks_json, s.bids_json,
+                s.best_ask, s.best_bid, s.spread
+            ))
+
         with sqlite3.connect(self.db_path) as conn:
             conn.executemany("""
                 INSERT INTO order_book_snapshots
                 (timestamp, platform, token_id, market_id, asks_json, bids_json,
                  best_ask, best_bid, spread)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [(
-                s.timestamp, s.platform, s.token_id, s.market_id,
-                s.asks_json, s.bids_json,
-                s.best_ask, s.best_bid, s.spread
-            ) for s in batch])
+            """, rows)
+        return len(rows)
 
     def _write_opportunity_batch(self, batch: List[OpportunityLog]):
         """Synchronous batch write for opportunities (runs in executor)."""
@@ -134,7 +134,7 @@ class LiveTradeExecutor(ITradeExecutor):
         Args:
             client: ClobClient instance
             rate_limiter: APIRateLimiter instance
-            place_order_func: Reference to ArbitrageBot._place_order method
+            place_order_func: Callable placing one order (token_id, amount, price)
         """
         self.client = client
         self.rate_limiter = rate_limiter
@@ -7,6 +7,7 @@ Continuously monitors open positions and executes exits when:
 - Market resolution is imminent
 """
 import asyncio
+from concurrent.futures import Executor
 from datetime import datetime
 from typing import Dict, List, Optional, Callable
 from backend.logger import logger
@@ -102,7 +103,9 @@ class PositionMonitor:
         """Check all positions for exit conditions."""
         exits_triggered = []
 
-        for position in self.positions:
+        # Iterate a snapshot: the exit callback awaits, and the engine may
+        # record a trade (append to the positions deque) in the meantime
+        for position in list(self.positions):
             if position.get('status') != 'EXECUTED':
                 continue
 
@@ -297,16 +300,18 @@ class ExitExecutor:
     Executes position exits (sells) when triggered by PositionMonitor.
     """
 
-    def __init__(self, client, rate_limiter):
+    def __init__(self, client, rate_limiter, executor: Optional[Executor] = None):
         """
         Initialize exit executor.
 
         Args:
             client: ClobClient for order execution.
             rate_limiter: APIRateLimiter for throttling.
+            executor: Thread pool for blocking order calls (None = loop default).
         """
         self.client = client
         self.rate_limiter = rate_limiter
+        self.executor = executor
 
     async def execute_exit(
         self,
@@ -349,9 +354,8 @@ class ExitExecutor:
         )
 
         try:
-            # Rate limit
-            await self.rate_limiter.acquire('orders')
-            await self.rate_limiter.acquire('orders')
+            # Rate limit (one reservation covers both sell orders)
+            await self.rate_limiter.acquire_n('orders', 2)
 
             loop = asyncio.get_running_loop()
 
@@ -365,11 +369,11 @@ class ExitExecutor:
             # Execute sell orders in parallel
             # Using limit orders at current bid price for better fills
             t1 = loop.run_in_executor(
-                None,
+                self.executor,
                 lambda: self._place_sell_order(yes_token, shares, current_yes_price)
             )
             t2 = loop.run_in_executor(
-                None,
+                self.executor,
                 lambda: self._place_sell_order(no_token, shares, current_no_price)
             )
 
@@ -412,6 +416,36 @@ class ExitExecutor:
             logger.error(f"Exit execution error: {e}")
             return {'success': False, 'error': str(e)}
 
+    async def unwind_leg(self, token_id: str, shares: float, price: float) -> bool:
+        """
+        Sell back a single leg whose hedge did not fill.
+
+        Args:
+            token_id: Token of the leg that filled.
+            shares: Number of shares to sell.
+            price: Limit price (current best bid).
+
+        Returns:
+            True if the sell order was accepted.
+        """
+        try:
+            await self.rate_limiter.acquire('orders')
+            loop = asyncio.get_running_loop()
+            resp = await loop.run_in_executor(
+                self.executor, self._place_sell_order, token_id, shares, price
+            )
+            if isinstance(resp, dict) and resp.get('success') is True:
+                logger.info(f"Unwind sell accepted for {token_id}: {shares} @ {price:.4f}")
+                return True
+            error = f"order rejected: {resp}"
+        except Exception as e:
+            error = str(e)
+        logger.critical(
+            f"Unwind failed for {token_id} ({shares} shares): {error}. "
+            "Close the position manually!"
+        )
+        return False
+
     def _place_sell_order(self, token_id: str, amount: float, price: float):
         """Place a sell order (synchronous, for run_in_executor)."""
         from py_clob_client.clob_types import OrderArgs, OrderType
@@ -421,15 +455,16 @@ class ExitExecutor:
             raise RuntimeError("Client not initialized")
 
         try:
-            resp = self.client.create_and_post_order(
+            # Order type is chosen at post time; OrderArgs has no such field
+            signed = self.client.create_order(
                 OrderArgs(
                     price=price,
                     size=amount,
                     side=SELL,
-                    token_id=token_id,
-                    order_type=OrderType.GTC  # Good-til-canceled for sells
+                    token_id=token_id
                 )
             )
+            resp = self.client.post_order(signed, OrderType.GTC)  # Good-til-canceled for sells
             logger.debug(f"Sell order placed: {resp}")
             return resp
         except Exception as e:
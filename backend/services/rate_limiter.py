@@ -39,6 +39,25 @@ class RateLimiter:
         Returns:
             Time waited in seconds (0 if no wait was needed).
         """
+        return await self.acquire_n(1)
+
+    async def acquire_n(self, n: int) -> float:
+        """
+        Acquire n rate limit slots at once, waiting if necessary.
+
+        All n slots are reserved under one lock hold, so requests that must
+        go out together (e.g. both legs of a trade) are never split by
+        another caller taking the slot in between.
+
+        Args:
+            n: Number of slots, at most max_requests.
+
+        Returns:
+            Time waited in seconds (0 if no wait was needed).
+        """
+        if not 0 < n <= self.max_requests:
+            raise ValueError(f"n must be between 1 and {self.max_requests}, got {n}")
+
         async with self._lock:
             now = time.time()
             waited = 0.0
@@ -46,9 +65,10 @@ class RateLimiter:
             # Clean up old requests outside the window
             self._cleanup(now)
 
-            # If at capacity, wait for oldest request to expire
-            if len(self.requests) >= self.max_requests:
-                wait_time = self.requests[0] + self.time_window - now
+            # If over capacity, wait until enough of the oldest requests expire
+            excess = len(self.requests) + n - self.max_requests
+            if excess > 0:
+                wait_time = self.requests[excess - 1] + self.time_window - now
                 if wait_time > 0:
                     waited = wait_time
                     await asyncio.sleep(wait_time)
@@ -56,8 +76,9 @@ class RateLimiter:
                     now = time.time()
                     self._cleanup(now)
 
-            # Record this request
-            self.requests.append(time.time())
+            # Record these requests
+            now = time.time()
+            self.requests.extend([now] * n)
             return waited
 
     def _cleanup(self, now: float):
@@ -128,6 +149,19 @@ class APIRateLimiter:
         Args:
             endpoint: Endpoint type ('orders', 'markets', or 'default').
 
+        Returns:
+            Time waited in seconds.
+        """
+        return await self.acquire_n(endpoint, 1)
+
+    async def acquire_n(self, endpoint: str = 'default', n: int = 1) -> float:
+        """
+        Acquire n rate limit slots for an endpoint in one pass.
+
+        Args:
+            endpoint: Endpoint type ('orders', 'markets', or 'default').
+            n: Number of requests about to be sent.
+
         Returns:
             Time waited in seconds.
         """
@@ -135,14 +169,14 @@ class APIRateLimiter:
         limiter = self.limiters.get(endpoint, self.limiters['default'])
 
         # Acquire endpoint limit
-        endpoint_wait = await limiter.acquire()
+        endpoint_wait = await limiter.acquire_n(n)
 
         # Acquire global limit
-        global_wait = await self._global_limiter.acquire()
+        global_wait = await self._global_limiter.acquire_n(n)
 
         total_wait = endpoint_wait + global_wait
         if total_wait > 0:
-            logger.debug(f"Rate limited: waited {total_wait:.3f}s for {endpoint}")
+            logger.debug(f"Rate limited: waited {total_wait:.3f}s for {n}x {endpoint}")
 
         return total_wait
 
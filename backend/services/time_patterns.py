@@ -7,9 +7,11 @@ Adjusts trading behavior based on:
 - Market event timing (e.g., around resolution times)
 """
 
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from typing import Deque, Optional, Tuple
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -220,15 +222,27 @@ class MomentumDetector:
     IMPROVING_THRESHOLD = -0.01  # Cost dropping by >1%
     DEGRADING_THRESHOLD = 0.01   # Cost rising by >1%
 
-    def __init__(self, lookback_seconds: int = 60):
+    def __init__(
+        self,
+        lookback_seconds: int = 60,
+        max_samples: int = 64,
+        max_markets: int = 10_000
+    ):
         """
         Initialize momentum detector.
 
         Args:
             lookback_seconds: How far back to look for momentum
+            max_samples: Observations kept per market; older ones drop off
+            max_markets: Markets tracked at once; the least recently
+                recorded market is forgotten when a new one arrives
         """
         self.lookback_seconds = lookback_seconds
-        self._cost_history: dict = {}  # market_id -> [(timestamp, cost), ...]
+        self.max_samples = max_samples
+        self.max_markets = max_markets
+        # market_id -> deque of (monotonic timestamp, cost), oldest first,
+        # kept in least-recently-recorded order
+        self._cost_history: "OrderedDict[str, Deque[Tuple[float, float]]]" = OrderedDict()
 
     def record_cost(self, market_id: str, cost: float) -> None:
         """
@@ -238,19 +252,7 @@ class MomentumDetector:
             market_id: Market identifier
             cost: Combined cost (YES + NO)
         """
-        now = datetime.now(timezone.utc).timestamp()
-
-        if market_id not in self._cost_history:
-            self._cost_history[market_id] = []
-
-        self._cost_history[market_id].append((now, cost))
-
-        # Clean old entries
-        cutoff = now - self.lookback_seconds
-        self._cost_history[market_id] = [
-            (ts, c) for ts, c in self._cost_history[market_id]
-            if ts >= cutoff
-        ]
+        self._record(market_id, cost)
 
     def detect_momentum(self, market_id: str, current_cost: float) -> str:
         """
@@ -263,12 +265,46 @@ class MomentumDetector:
         Returns:
             'NEW', 'IMPROVING', 'STABLE', or 'DEGRADING'
         """
-        if market_id not in self._cost_history or not self._cost_history[market_id]:
-            return 'NEW'
+        return self._classify(self._cost_history.get(market_id), current_cost)
 
+    def record_and_detect(self, market_id: str, cost: float) -> str:
+        """
+        record_cost() followed by detect_momentum() with a single history lookup.
+
+        Args:
+            market_id: Market identifier
+            cost: Combined cost (YES + NO), recorded and classified
+
+        Returns:
+            'NEW', 'IMPROVING', 'STABLE', or 'DEGRADING'
+        """
+        return self._classify(self._record(market_id, cost), cost)
+
+    def _record(self, market_id: str, cost: float) -> Deque[Tuple[float, float]]:
+        """Append an observation, expire old ones and return the market's history."""
+        now = time.monotonic()
+        histories = self._cost_history
+
+        history = histories.get(market_id)
+        if history is None:
+            if len(histories) >= self.max_markets:
+                histories.popitem(last=False)
+            history = histories[market_id] = deque(maxlen=self.max_samples)
+        else:
+            histories.move_to_end(market_id)
+        history.append((now, cost))
+
+        # Samples are in time order, so expired ones are all at the left
+        cutoff = now - self.lookback_seconds
+        while history[0][0] < cutoff:
+            history.popleft()
+
+        return history
+
+    def _classify(self, history: Optional[Deque[Tuple[float, float]]], current_cost: float) -> str:
+        """Momentum label for current_cost against a market's cost history."""
         # Get oldest cost in lookback window
-        history = self._cost_history[market_id]
-        if len(history) < 2:
+        if not history or len(history) < 2:
             return 'NEW'
 
         oldest_cost = history[0][1]
@@ -294,8 +330,15 @@ class MomentumDetector:
         Returns:
             Priority score (0.5 to 1.5)
         """
-        momentum = self.detect_momentum(market_id, current_cost)
+        return self.priority_for(self.detect_momentum(market_id, current_cost))
 
+    @staticmethod
+    def priority_for(momentum: str) -> float:
+        """
+        Map an already detected momentum label to its priority score.
+
+        Lets callers that just ran detect_momentum() skip detecting again.
+        """
         if momentum == 'IMPROVING':
             return 1.5  # High priority - opportunity getting better
         elif momentum == 'DEGRADING':
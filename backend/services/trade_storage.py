@@ -106,6 +106,41 @@ class TradeStorage:
                 ON trades(platform)
             """)
 
+    _INSERT_TRADE = """
+        INSERT INTO trades (
+            platform, market_id, side, shares, entry_cost, exit_value,
+            pnl, roi, yes_price, no_price, status, timestamp,
+            levels_yes, levels_no, metadata
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _trade_row(trade: Dict) -> tuple:
+        """Column values for one trade, in _INSERT_TRADE order."""
+        timestamp = trade.get('timestamp')
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+        elif timestamp is None:
+            timestamp = datetime.now().isoformat()
+
+        return (
+            trade.get('platform', 'polymarket'),
+            trade.get('market_id'),
+            trade.get('side', 'BOTH'),
+            trade.get('shares'),
+            trade.get('entry_cost'),
+            trade.get('exit_value'),
+            trade.get('pnl'),
+            trade.get('roi'),
+            trade.get('yes_price'),
+            trade.get('no_price'),
+            trade.get('status', 'EXECUTED'),
+            timestamp,
+            trade.get('levels_yes'),
+            trade.get('levels_no'),
+            json.dumps(trade.get('metadata', {}))
+        )
+
     def save_trade(self, trade: Dict) -> int:
         """
         Save a trade to the database.
@@ -116,38 +151,26 @@ class TradeStorage:
         Returns:
             The ID of the inserted trade.
         """
-        timestamp = trade.get('timestamp')
-        if isinstance(timestamp, datetime):
-            timestamp = timestamp.isoformat()
-        elif timestamp is None:
-            timestamp = datetime.now().isoformat()
-
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                INSERT INTO trades (
-                    platform, market_id, side, shares, entry_cost, exit_value,
-                    pnl, roi, yes_price, no_price, status, timestamp,
-                    levels_yes, levels_no, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trade.get('platform', 'polymarket'),
-                trade.get('market_id'),
-                trade.get('side', 'BOTH'),
-                trade.get('shares'),
-                trade.get('entry_cost'),
-                trade.get('exit_value'),
-                trade.get('pnl'),
-                trade.get('roi'),
-                trade.get('yes_price'),
-                trade.get('no_price'),
-                trade.get('status', 'EXECUTED'),
-                timestamp,
-                trade.get('levels_yes'),
-                trade.get('levels_no'),
-                json.dumps(trade.get('metadata', {}))
-            ))
+            cursor = conn.execute(self._INSERT_TRADE, self._trade_row(trade))
             return cursor.lastrowid
 
+    def save_trades(self, trades: List[Dict]) -> List[int]:
+        """
+        Save several trades in one transaction.
+
+        Args:
+            trades: Trade dictionaries, as accepted by save_trade.
+
+        Returns:
+            The IDs of the inserted trades, in the same order.
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            return [
+                conn.execute(self._INSERT_TRADE, self._trade_row(trade)).lastrowid
+                for trade in trades
+            ]
+
     def save_cross_platform_trade(self, trade: Dict) -> int:
         """
         Save a cross-platform trade to the database.
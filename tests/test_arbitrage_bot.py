@@ -0,0 +1,399 @@
+"""
+Tests for ArbitrageBot order submission, market data handling,
+position tracking and shutdown.
+"""
+import pytest
+import asyncio
+import sys
+import os
+import json
+import threading
+from collections import deque
+from unittest.mock import AsyncMock, MagicMock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backend.arbitrage as arbitrage
+from backend.arbitrage import ArbitrageBot, MarketImpactCalculator
+from backend.config import Config
+
+
+@pytest.fixture
+def live_bot(tmp_path, monkeypatch):
+    """Create a live-mode bot with its trade database in tmp_path."""
+    monkeypatch.chdir(tmp_path)  # trade database is created relative to cwd
+    config = Config(
+        POLY_API_KEY='key', POLY_API_SECRET='secret', POLY_API_PASSPHRASE='pass',
+        PRIVATE_KEY='', CAPITAL_PER_TRADE=50.0, MIN_PROFIT_MARGIN=0.02,
+        MIN_MARKET_VOLUME=0, PAPER_TRADING_ENABLED=False,
+        DATA_COLLECTION_ENABLED=False
+    )
+    return ArbitrageBot(config)
+
+
+class TestOrderPairUnwind:
+    """Test cases for one-leg fills in live order submission."""
+
+    @pytest.fixture
+    def bot(self, live_bot):
+        """Create a live-mode bot with mocked order placement."""
+        bot = live_bot
+        bot.order_books['yes-token'] = {'asks': [], 'bids': [{'price': '0.44', 'size': '100'}]}
+        bot.order_books['no-token'] = {'asks': [], 'bids': [{'price': '0.49', 'size': '100'}]}
+        bot.exit_executor.unwind_leg = AsyncMock(return_value=True)
+        return bot
+
+    @pytest.mark.asyncio
+    async def test_one_leg_fill_is_unwound(self, bot):
+        """Should sell back the filled leg and cool the market down."""
+        bot._place_order_batch = lambda orders: [{'success': True}, {'success': False}]
+
+        result = await bot.execute_trade('market-1', 'yes-token', 'no-token', 0.45, 0.50)
+        await asyncio.sleep(0)  # let the unwind task run
+
+        assert result is False
+        bot.exit_executor.unwind_leg.assert_awaited_once_with('yes-token', 52.63, 0.44)
+        executing, remaining = bot.market_gate.status('market-1')
+        assert executing is False
+        assert remaining > 0
+
+    @pytest.mark.asyncio
+    async def test_both_legs_filled_no_unwind(self, bot):
+        """Should not unwind when both legs filled."""
+        bot._place_order_batch = lambda orders: [{'success': True}, {'success': True}]
+
+        result = await bot.execute_trade('market-1', 'yes-token', 'no-token', 0.45, 0.50)
+        await asyncio.sleep(0)
+
+        assert result is True
+        bot.exit_executor.unwind_leg.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_leg_without_success_flag_not_filled(self, bot):
+        """Should not count a leg as filled unless the CLOB reports success."""
+        bot._place_order_batch = lambda orders: [{'orderID': 'abc'}, {'success': True}]
+
+        result = await bot.execute_trade('market-1', 'yes-token', 'no-token', 0.45, 0.50)
+        await asyncio.sleep(0)
+
+        assert result is False
+        bot.exit_executor.unwind_leg.assert_awaited_once_with('no-token', 52.63, 0.49)
+
+    @pytest.mark.asyncio
+    async def test_both_legs_failed_no_cooldown(self, bot):
+        """Should leave the market free to retry when nothing filled."""
+        bot._place_order_batch = lambda orders: [{'success': False}, {'success': False}]
+
+        result = await bot.execute_trade('market-1', 'yes-token', 'no-token', 0.45, 0.50)
+        await asyncio.sleep(0)
+
+        assert result is False
+        bot.exit_executor.unwind_leg.assert_not_awaited()
+        assert bot.market_gate.status('market-1') == (False, 0)
+
+
+def _track_markets(bot, *market_ids):
+    """Register YES/NO tokens 'yes-<id>' and 'no-<id>' for each market."""
+    for market_id in market_ids:
+        yes_token, no_token = f'yes-{market_id}', f'no-{market_id}'
+        bot.markets_whitelist.append(market_id)
+        bot.market_details[market_id] = {
+            'tokens': [{'token_id': yes_token}, {'token_id': no_token}]
+        }
+        bot._market_tokens[market_id] = (yes_token, no_token)
+        for token_id in (yes_token, no_token):
+            bot.token_to_market[token_id] = market_id
+            bot.token_dispatch[token_id] = (market_id, yes_token, no_token)
+
+
+class FakeWebSocket:
+    """Replays queued frames, then stops the bot and idles like a quiet feed."""
+
+    def __init__(self, bot, frames):
+        self.bot = bot
+        self.frames = list(frames)
+        self.sent = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def send(self, msg):
+        self.sent.append(json.loads(msg))
+
+    async def recv(self):
+        if self.frames:
+            return self.frames.pop(0)
+        self.bot.running = False
+        await asyncio.sleep(3600)
+
+
+class TestWebSocketBatching:
+    """Test cases for batching bursts of WS frames."""
+
+    @pytest.fixture
+    def bot(self, live_bot):
+        """Create a bot tracking two markets, with arbitrage checks mocked."""
+        _track_markets(live_bot, 'market-1', 'market-2')
+        live_bot.check_arbitrage = AsyncMock()
+        live_bot.running = True
+        return live_bot
+
+    async def _listen(self, bot, monkeypatch, frames):
+        ws = FakeWebSocket(bot, frames)
+        monkeypatch.setattr(arbitrage.websockets, 'connect', lambda url: ws)
+        await asyncio.wait_for(bot.connect_and_listen(), 5)
+        return ws
+
+    def _frame(self, token_id, side='asks', price='0.45'):
+        return json.dumps({'token_id': token_id, side: [{'price': price, 'size': '100'}]})
+
+    @pytest.mark.asyncio
+    async def test_burst_checks_each_market_once(self, bot, monkeypatch):
+        """Should check each touched market once, past a malformed frame."""
+        frames = [
+            self._frame('yes-market-1'),
+            self._frame('no-market-1', price='0.48'),
+            '{not json',
+            self._frame('yes-market-1', price='0.44'),
+            self._frame('no-market-2', side='bids'),
+        ]
+
+        await self._listen(bot, monkeypatch, frames)
+
+        checked = [call.args[0] for call in bot.check_arbitrage.await_args_list]
+        assert sorted(bot.token_dispatch[t][0] for t in checked) == ['market-1', 'market-2']
+        assert bot.order_books['yes-market-1']['asks'][0]['price'] == '0.44'
+        assert bot.order_books['no-market-2']['bids'][0]['price'] == '0.45'
+
+    @pytest.mark.asyncio
+    async def test_bad_update_skips_only_its_token(self, bot, monkeypatch):
+        """Should still apply and check the rest of a batch around a bad book."""
+        frames = [
+            json.dumps({'token_id': 'yes-market-1', 'asks': [{'price': 'oops', 'size': '1'}]}),
+            self._frame('yes-market-2'),
+        ]
+
+        await self._listen(bot, monkeypatch, frames)
+
+        assert 'yes-market-1' not in bot._asks_by_token
+        bot.check_arbitrage.assert_awaited_once_with('yes-market-2')
+
+
+class TestRejectedVersions:
+    """Test cases for skipping markets whose books haven't changed."""
+
+    @pytest.fixture
+    def bot(self, live_bot, monkeypatch):
+        """Create a bot with a cheap book whose depth search finds nothing."""
+        _track_markets(live_bot, 'market-1')
+        for token_id, price in (('yes-market-1', '0.45'), ('no-market-1', '0.48')):
+            live_bot._apply_book_update(
+                {'token_id': token_id, 'asks': [{'price': price, 'size': '100'}]}
+            )
+        self.search = MagicMock(return_value=(0.0, 0.0, 0.0))
+        monkeypatch.setattr(MarketImpactCalculator, 'find_optimal_trade_size', self.search)
+        return live_bot
+
+    @pytest.mark.asyncio
+    async def test_unchanged_books_not_searched_again(self, bot):
+        """Should skip the depth search until one of the books changes."""
+        await bot.check_arbitrage('yes-market-1')
+        await bot.check_arbitrage('no-market-1')
+        assert self.search.call_count == 1
+
+        bot._apply_book_update(
+            {'token_id': 'no-market-1', 'asks': [{'price': '0.47', 'size': '100'}]}
+        )
+        await bot.check_arbitrage('yes-market-1')
+        assert self.search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_bids_only_update_keeps_rejection(self, bot):
+        """Should not search again when only the bid side changed."""
+        await bot.check_arbitrage('yes-market-1')
+        bot._apply_book_update(
+            {'token_id': 'yes-market-1', 'bids': [{'price': '0.44', 'size': '100'}]}
+        )
+        await bot.check_arbitrage('yes-market-1')
+
+        assert self.search.call_count == 1
+
+
+class TestPositionTracking:
+    """Test cases for the bounded position history and its open count."""
+
+    @pytest.fixture
+    def bot(self, live_bot):
+        """Create a bot that tracks at most two positions."""
+        live_bot.positions = deque(maxlen=2)
+        return live_bot
+
+    def _position(self, market_id='market-1'):
+        return {'market_id': market_id, 'shares': 10.0, 'status': 'EXECUTED'}
+
+    def test_eviction_keeps_open_count(self, bot):
+        """Should uncount an open position when it drops off the history."""
+        first, second, third = (self._position(f'market-{i}') for i in range(3))
+        for position in (first, second, third):
+            bot._record_position(position['market_id'], position)
+
+        assert bot._open_positions_count == 2
+        assert bot.get_positions_for_market('market-0') == []
+        assert list(bot.positions) == [second, third]
+
+    def test_closing_evicted_position_not_uncounted_twice(self, bot):
+        """Should leave the count alone when closing a position already evicted."""
+        first, second, third = (self._position(f'market-{i}') for i in range(3))
+        for position in (first, second, third):
+            bot._record_position(position['market_id'], position)
+
+        bot._mark_position_closed(first)
+        assert bot._open_positions_count == 2
+
+        bot._mark_position_closed(second)
+        assert bot._open_positions_count == 1
+
+    def test_evicts_oldest_of_equal_positions(self, bot):
+        """Should drop the evicted position itself, not an equal-looking one."""
+        first, second = self._position(), self._position()
+        bot._record_position('market-1', first)
+        bot._record_position('market-1', second)
+        bot._record_position('market-2', self._position('market-2'))
+
+        siblings = bot.get_positions_for_market('market-1')
+        assert len(siblings) == 1
+        assert siblings[0] is second
+
+
+class TestShutdown:
+    """Test cases for cleanup when the engine task stops."""
+
+    @pytest.fixture
+    def bot(self, live_bot):
+        """Create a live-mode bot whose feed returns once stopped."""
+        bot = live_bot
+        stopped = asyncio.Event()
+
+        async def listen():
+            await stopped.wait()
+
+        bot.fetch_markets = AsyncMock()
+        bot.markets_whitelist = ['market-1']  # skips the 10s refetch wait
+        bot.connect_and_listen = listen
+        bot.stopped = stopped
+        return bot
+
+    async def _run_and_stop(self, bot):
+        task = asyncio.create_task(bot.run())
+        await asyncio.sleep(0.01)
+        bot.stop()
+        bot.stopped.set()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_warmup_cancelled_on_stop(self, bot):
+        """Should cancel metadata warm-up still running at shutdown."""
+        warmup = asyncio.create_task(asyncio.sleep(3600))
+        bot._order_warmup_task = warmup
+
+        await self._run_and_stop(bot)
+        await asyncio.sleep(0)
+
+        assert warmup.cancelled()
+        assert bot._order_warmup_task is None
+
+    @pytest.mark.asyncio
+    async def test_thread_pools_shut_down_on_stop(self, bot):
+        """Should release the order and CLOB worker threads."""
+        await self._run_and_stop(bot)
+
+        with pytest.raises(RuntimeError):
+            bot._order_pool.submit(lambda: None)
+        with pytest.raises(RuntimeError):
+            bot._clob_pool.submit(lambda: None)
+
+
+class TestTradeWriter:
+    """Test cases for background trade persistence."""
+
+    def _trade(self, market_id='market-1'):
+        return {
+            'market_id': market_id, 'side': 'BOTH', 'shares': 10.0,
+            'entry_cost': 9.3, 'exit_value': 10.0, 'pnl': 0.7, 'roi': 7.5,
+            'yes_price': 0.45, 'no_price': 0.48, 'status': 'EXECUTED'
+        }
+
+    def _start_writer(self, bot):
+        bot._trade_writer_task = asyncio.create_task(bot._trade_writer())
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_queued_trades(self, live_bot):
+        """Should save every queued trade before the writer exits."""
+        self._start_writer(live_bot)
+        trades = [self._trade(f'market-{i}') for i in range(3)]
+        for trade in trades:
+            live_bot._persist_trade(trade)
+
+        await live_bot._stop_trade_writer()
+
+        assert live_bot._trade_writer_task is None
+        for trade in trades:
+            row = live_bot.trade_storage.get_trade_by_id(trade['id'])
+            assert row['market_id'] == trade['market_id']
+
+    @pytest.mark.asyncio
+    async def test_close_during_write_is_saved(self, live_bot):
+        """Should store CLOSED for a position closed while its row was written."""
+        storage = live_bot.trade_storage
+        save_trades = storage.save_trades
+        started, release = threading.Event(), threading.Event()
+
+        def slow_save_trades(rows):
+            started.set()
+            release.wait(5)
+            return save_trades(rows)
+
+        storage.save_trades = slow_save_trades
+        self._start_writer(live_bot)
+        trade = self._trade()
+        live_bot._record_position('market-1', trade)
+        live_bot._persist_trade(trade)
+
+        await asyncio.to_thread(started.wait, 5)
+        live_bot._mark_position_closed(trade)  # no id yet
+        release.set()
+        await live_bot._stop_trade_writer()
+
+        assert storage.get_trade_by_id(trade['id'])['status'] == 'CLOSED'
+        assert live_bot._open_positions_count == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_saves_rows_one_by_one(self, live_bot):
+        """Should fall back to single-row saves when the batch insert fails."""
+        live_bot.trade_storage.save_trades = MagicMock(side_effect=Exception("database is locked"))
+        self._start_writer(live_bot)
+        trades = [self._trade(f'market-{i}') for i in range(2)]
+        for trade in trades:
+            live_bot._persist_trade(trade)
+
+        await live_bot._stop_trade_writer()
+
+        for trade in trades:
+            assert live_bot.trade_storage.get_trade_by_id(trade['id']) is not None
+
+    @pytest.mark.asyncio
+    async def test_full_queue_saves_inline(self, live_bot):
+        """Should save immediately when the writer is running but backed up."""
+        live_bot._trade_write_queue = asyncio.Queue(maxsize=1)
+        live_bot._trade_write_queue.put_nowait(self._trade('queued'))
+        live_bot._trade_writer_task = asyncio.create_task(asyncio.sleep(3600))  # busy writer
+        trade = self._trade()
+
+        live_bot._persist_trade(trade)
+
+        assert live_bot.trade_storage.get_trade_by_id(trade['id'])['market_id'] == 'market-1'
+        live_bot._trade_writer_task.cancel()
@@ -186,6 +186,38 @@ class TestDataCollector:
         # Buffer should be empty after stop
         assert len(collector._snapshot_buffer) == 0
 
+    @pytest.mark.asyncio
+    async def test_flush_serialises_buffered_books(self, collector):
+        """Best prices and JSON should be derived from the book at flush time."""
+        collector._running = True
+        collector.capture_snapshot(
+            token_id="token_1",
+            market_id="market_1",
+            order_book={
+                'asks': [{'price': '0.45', 'size': '100'}],
+                'bids': [{'price': '0.40', 'size': '50'}]
+            }
+        )
+        await collector._flush_buffers()
+
+        [snap] = collector.get_snapshots_for_period(0, int(time.time() * 1000) + 1000)
+        assert snap['best_ask'] == 0.45
+        assert snap['best_bid'] == 0.40
+        assert snap['spread'] == pytest.approx(0.05)
+        assert snap['asks_json'] == '[{"price": "0.45", "size": "100"}]'
+        assert collector.stats['snapshots_flushed'] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_skips_unserialisable_books(self, collector):
+        """A book that is not JSON serialisable should not sink the batch."""
+        collector._running = True
+        collector.capture_snapshot("bad", "market_1", {'asks': [object()], 'bids': []})
+        collector.capture_snapshot("good", "market_1", {'asks': [], 'bids': []})
+        await collector._flush_buffers()
+
+        assert collector.get_snapshot_count() == 1
+        assert collector.stats['snapshots_flushed'] == 1
+
     def test_get_available_date_range_empty(self, collector):
         min_ts, max_ts = collector.get_available_date_range()
         assert min_ts is None
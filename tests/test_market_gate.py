@@ -0,0 +1,105 @@
+"""
+Tests for MarketGate.
+"""
+import pytest
+import asyncio
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.arbitrage import MarketGate
+
+
+class TestMarketGate:
+    """Test cases for MarketGate."""
+
+    def test_enter_new_market(self):
+        """Should let an unseen market in and mark it executing."""
+        gate = MarketGate(cooldown_seconds=30)
+        assert gate.try_enter("market_1", now=1000.0) is True
+        assert gate.status("market_1", now=1000.0) == (True, 0)
+
+    def test_blocks_while_executing(self):
+        """Should refuse a second entry until the first one exits."""
+        gate = MarketGate(cooldown_seconds=30)
+        gate.try_enter("market_1", now=1000.0)
+        assert gate.try_enter("market_1", now=1000.0) is False
+
+        gate.exit("market_1", traded=False)
+        assert gate.try_enter("market_1", now=1000.0) is True
+
+    def test_failed_attempt_leaves_no_state(self):
+        """Should forget a market whose attempt did not trade."""
+        gate = MarketGate(cooldown_seconds=30)
+        gate.try_enter("market_1", now=1000.0)
+        gate.exit("market_1", traded=False)
+        assert gate.status("market_1") == (False, 0)
+        assert gate._state == {}
+
+    def test_trade_starts_cooldown(self):
+        """Should block re-entry for the cooldown after a trade."""
+        gate = MarketGate(cooldown_seconds=30)
+        gate.try_enter("market_1", now=1000.0)
+        gate.exit("market_1", traded=True, now=1000.0)
+
+        assert gate.status("market_1", now=1010.0) == (False, 20.0)
+        assert gate.try_enter("market_1", now=1010.0) is False
+        assert gate.try_enter("market_1", now=1031.0) is True
+
+    def test_different_markets_independent(self):
+        """Gate state on one market shouldn't affect others."""
+        gate = MarketGate(cooldown_seconds=30)
+        gate.try_enter("market_1", now=1000.0)
+        gate.exit("market_1", traded=True, now=1000.0)
+        assert gate.try_enter("market_2", now=1001.0) is True
+
+    def test_expired_cooldowns_are_forgotten(self):
+        """Should drop idle markets once their cooldown has long expired."""
+        gate = MarketGate(cooldown_seconds=30)
+        gate.try_enter("market_1", now=1000.0)
+        gate.exit("market_1", traded=True, now=1000.0)
+
+        gate.try_enter("market_2", now=1061.0)
+        gate.exit("market_2", traded=True, now=1061.0)
+
+        assert "market_1" not in gate._state
+        assert gate.status("market_1", now=1061.0) == (False, 0)
+        assert gate.status("market_2", now=1061.0) == (False, 30.0)
+
+    def test_retrade_supersedes_earlier_expiry(self):
+        """Should keep a market whose earlier cooldown was replaced by a new trade."""
+        gate = MarketGate(cooldown_seconds=30)
+        gate.try_enter("market_1", now=1000.0)
+        gate.exit("market_1", traded=True, now=1000.0)
+        gate.try_enter("market_1", now=1031.0)
+        gate.exit("market_1", traded=True, now=1031.0)
+
+        # market_1's first expiry (1030) is stale by now and must not evict it
+        gate.try_enter("market_2", now=1061.0)
+        gate.exit("market_2", traded=True, now=1061.0)
+
+        assert gate.status("market_1", now=1061.0) == (False, 0)
+        assert gate.try_enter("market_1", now=1055.0) is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_enter(self):
+        """Only one of several concurrent attempts should get in."""
+        gate = MarketGate(cooldown_seconds=30)
+
+        async def try_enter(market_id):
+            await asyncio.sleep(0)
+            return gate.try_enter(market_id)
+
+        results = await asyncio.gather(
+            try_enter("market_1"),
+            try_enter("market_1"),
+            try_enter("market_1")
+        )
+
+        assert sum(results) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -11,7 +11,7 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from backend.arbitrage import MarketImpactCalculator, MarketImpactResult
+from backend.arbitrage import MarketImpactCalculator, MarketImpactResult, BookSide, _prepare_book
 
 
 class TestMarketImpactCalculator:
@@ -106,6 +106,55 @@ class TestMarketImpactCalculator:
         assert result.effective_price == 0.45
         assert result.levels_consumed == 1
 
+    def test_prepared_book_matches_raw_book(self):
+        """Should give identical results for raw and pre-parsed books."""
+        book = [
+            {"price": "0.40", "size": "10"},
+            {"price": "0.45", "size": "0"},
+            {"price": "0.50", "size": "20"},
+            {"price": "0.60", "size": "70"},
+        ]
+        prepared = _prepare_book(book)
+        assert prepared[:3] == ([0.40, 0.50, 0.60], [10.0, 20.0, 70.0], [10.0, 30.0, 100.0])
+        assert prepared[3] == pytest.approx([4.0, 14.0, 56.0])
+
+        for shares in (5, 10, 25, 30, 99, 100, 150):
+            raw = MarketImpactCalculator.calculate_effective_cost(book, shares)
+            fast = MarketImpactCalculator.calculate_effective_cost(prepared, shares)
+            assert fast == raw
+
+    def test_prepare_book_sorts_unordered_levels(self):
+        """Should put levels in ascending price order before cutting depth."""
+        book = [
+            {"price": "0.60", "size": "70"},
+            {"price": "0.40", "size": "10"},
+            {"price": "0.50", "size": "20"},
+        ]
+        assert _prepare_book(book)[:3] == ([0.40, 0.50, 0.60], [10.0, 20.0, 70.0], [10.0, 30.0, 100.0])
+        assert _prepare_book(book, max_depth=2)[:3] == ([0.40, 0.50], [10.0, 20.0], [10.0, 30.0])
+        assert _prepare_book(book, max_depth=2)[3] == pytest.approx([4.0, 14.0])
+
+    def test_book_side_matches_raw_book(self):
+        """Should accept a BookSide anywhere a raw book is accepted."""
+        book = [
+            {"price": "0.45", "size": "50"},
+            {"price": "0.55", "size": "100"},
+        ]
+        side = BookSide.from_levels(book, version=3)
+        assert side.prices == [0.45, 0.55]
+        assert side.cumsize == [50.0, 150.0]
+        assert side.cumcost == pytest.approx([22.5, 77.5])
+        assert side.version == 3
+
+        for shares in (10, 50, 120, 200):
+            raw = MarketImpactCalculator.calculate_effective_cost(book, shares)
+            assert MarketImpactCalculator.calculate_effective_cost(side, shares) == raw
+
+        assert (
+            MarketImpactCalculator.find_optimal_trade_size(side, side, max_combined_cost=1.0) ==
+            MarketImpactCalculator.find_optimal_trade_size(book, book, max_combined_cost=1.0)
+        )
+
     # ========================================
     # Tests for find_optimal_trade_size
     # ========================================
@@ -154,6 +203,50 @@ class TestMarketImpactCalculator:
         # At 100 shares: higher than 0.98 (not profitable)
         assert cost_at_100 > 0.98
 
+    def test_optimal_size_solves_break_even(self):
+        """Should land within `precision` below the exact break-even size."""
+        yes_book = [
+            {"price": "0.45", "size": "50"},
+            {"price": "0.55", "size": "100"},
+        ]
+        no_book = [
+            {"price": "0.50", "size": "50"},
+            {"price": "0.60", "size": "100"},
+        ]
+
+        shares, eff_yes, eff_no = MarketImpactCalculator.find_optimal_trade_size(
+            yes_book, no_book, max_combined_cost=0.98, precision=0.1
+        )
+
+        # Past 50 shares: combined = 1.15 - 10 / s, which hits 0.98 at s = 10 / 0.17
+        break_even = 10 / 0.17
+        assert break_even - 0.1 - 1e-9 <= shares < break_even
+        assert eff_yes + eff_no < 0.98
+
+    def test_optimal_size_capped_by_liquidity(self):
+        """Should take the available depth, less the precision margin, when it stays profitable."""
+        yes_book = [{"price": "0.45", "size": "30"}, {"price": "0.46", "size": "20"}]
+        no_book = [{"price": "0.50", "size": "100"}]
+
+        shares, _, _ = MarketImpactCalculator.find_optimal_trade_size(
+            yes_book, no_book, max_combined_cost=0.98
+        )
+
+        assert shares == pytest.approx(49.9)
+
+    def test_optimal_size_rounds_within_depth(self):
+        """Rounding the size to cents should never exceed the thinner book."""
+        yes_book = [{"price": "0.45", "size": "30.37"}, {"price": "0.46", "size": "20.18"}]
+        no_book = [{"price": "0.50", "size": "100"}]
+
+        shares, _, _ = MarketImpactCalculator.find_optimal_trade_size(
+            yes_book, no_book, max_combined_cost=0.98, precision=1.0
+        )
+
+        assert round(shares, 2) <= 50.55
+        result = MarketImpactCalculator.calculate_effective_cost(yes_book, round(shares, 2))
+        assert result.has_sufficient_liquidity
+
     def test_no_profitable_size(self):
         """Should return 0 when never profitable."""
         yes_book = [{"price": "0.55", "size": "100"}]
@@ -76,6 +76,27 @@ class TestOpportunityManager:
         best = manager.get_best(n=3)
         assert len(best) == 3
 
+    def test_get_best_top_n_from_large_cache(self):
+        """Should return the N highest ROIs when the cache is larger than N."""
+        manager = OpportunityManager(min_profit_margin=0.05)
+        for i in range(20):
+            price = 0.30 + i * 0.005  # m0 is cheapest (best ROI)
+            manager.update(f"m{i}", f"y{i}", f"n{i}", price, price)
+
+        best = manager.get_best(n=3)
+        assert [o.market_id for o in best] == ["m0", "m1", "m2"]
+
+    def test_get_best_reranks_on_update(self):
+        """Should re-rank a market whose ROI changes on a later update."""
+        manager = OpportunityManager(min_profit_margin=0.05)
+        manager.update("m1", "y1", "n1", 0.40, 0.40)  # ROI=25%
+        manager.update("m2", "y2", "n2", 0.45, 0.45)  # ROI=11.11%
+
+        manager.update("m1", "y1", "n1", 0.46, 0.46)  # ROI drops below m2
+
+        best = manager.get_best(n=5)
+        assert [o.market_id for o in best] == ["m2", "m1"]
+
     def test_mark_executed(self):
         """Should mark opportunity as executed."""
         manager = OpportunityManager(min_profit_margin=0.02)
@@ -85,6 +106,20 @@ class TestOpportunityManager:
         opp = manager.get("m1")
         assert opp.executed is True
 
+    def test_mark_executed_moves_out_of_live_set(self):
+        """Should keep executed opportunities out of the live dict."""
+        manager = OpportunityManager(min_profit_margin=0.02)
+        manager.update("m1", "y1", "n1", 0.45, 0.45)
+        manager.mark_executed("m1")
+
+        assert "m1" not in manager.opportunities
+        assert manager.get("m1").executed is True
+
+        # Repricing makes it live again
+        manager.update("m1", "y1", "n1", 0.44, 0.45)
+        assert "m1" in manager.opportunities
+        assert manager.get("m1").executed is False
+
     def test_get_best_excludes_executed(self):
         """Should exclude executed opportunities from get_best."""
         manager = OpportunityManager(min_profit_margin=0.05)
@@ -112,11 +147,83 @@ class TestOpportunityManager:
         manager.update("m1", "y1", "n1", 0.45, 0.45)
 
         # Manually set timestamp to be old
-        manager.opportunities["m1"].timestamp = time.time() - 120
+        manager.opportunities["m1"].timestamp = time.monotonic() - 120
 
         manager.clear_stale(max_age=60)
         assert manager.get("m1") is None
 
+    def test_get_evicts_expired(self):
+        """Should lazily evict an entry past its TTL on read."""
+        manager = OpportunityManager(min_profit_margin=0.02, max_age=60)
+        manager.update("m1", "y1", "n1", 0.45, 0.45)
+        manager.opportunities["m1"].timestamp = time.monotonic() - 120
+
+        assert manager.get("m1") is None
+        assert "m1" not in manager.opportunities
+
+    def test_get_best_skips_expired(self):
+        """Should drop expired entries while ranking."""
+        manager = OpportunityManager(min_profit_margin=0.05, max_age=60)
+        manager.update("m1", "y1", "n1", 0.40, 0.40)  # Best ROI, but stale
+        manager.update("m2", "y2", "n2", 0.45, 0.45)
+        manager.opportunities["m1"].timestamp = time.monotonic() - 120
+
+        best = manager.get_best(n=5)
+        assert [o.market_id for o in best] == ["m2"]
+        assert "m1" not in manager.opportunities
+
+    def test_clear_stale_sweeps_above_watermark(self):
+        """Should run the full sweep once the cache exceeds the watermark."""
+        manager = OpportunityManager(min_profit_margin=0.02, high_watermark=1)
+        manager.update("m1", "y1", "n1", 0.45, 0.45)
+        manager.update("m2", "y2", "n2", 0.45, 0.45)
+        manager.opportunities["m1"].timestamp = time.monotonic() - 120
+
+        manager.clear_stale(max_age=60)
+        assert list(manager.opportunities) == ["m2"]
+
+    def test_clear_stale_stops_at_first_fresh_entry(self):
+        """Should keep live entries in update order and sweep only the stale prefix."""
+        manager = OpportunityManager(min_profit_margin=0.02, high_watermark=0)
+        manager.update("m1", "y1", "n1", 0.45, 0.45, now=100.0)
+        manager.update("m2", "y2", "n2", 0.45, 0.45, now=110.0)
+        manager.update("m1", "y1", "n1", 0.44, 0.45, now=150.0)  # m1 moves to the end
+
+        assert list(manager.opportunities) == ["m2", "m1"]
+        manager.clear_stale(max_age=30, now=170.0)
+        assert list(manager.opportunities) == ["m1"]
+
+    def test_update_reuses_cached_instance(self):
+        """Should update an existing entry in place instead of reallocating."""
+        manager = OpportunityManager(min_profit_margin=0.02)
+        first = manager.update("m1", "y1", "n1", 0.45, 0.45)
+        manager.mark_executed("m1")
+
+        second = manager.update("m1", "y1", "n1", 0.44, 0.45)
+        assert second is first
+        assert second.cost == 0.89
+        assert second.executed is False
+        assert manager.get_best(n=5) == [second]
+
+    def test_min_margin_change_updates_threshold(self):
+        """Should apply a changed margin to subsequent updates."""
+        manager = OpportunityManager(min_profit_margin=0.02)
+        assert manager.update("m1", "y1", "n1", 0.45, 0.50) is not None  # 0.95 < 0.98
+
+        manager.min_margin = 0.10
+        assert manager.min_margin == 0.10
+        assert manager.update("m1", "y1", "n1", 0.45, 0.50) is None  # 0.95 >= 0.90
+
+    def test_priority_score_cached_on_update(self):
+        """Should expose the momentum priority computed during update."""
+        manager = OpportunityManager(min_profit_margin=0.02)
+        opp = manager.update("m1", "y1", "n1", 0.45, 0.45)
+
+        assert opp.momentum == "NEW"
+        assert opp.priority_score == 1.2
+        assert manager.get_priority_score("m1") == 1.2
+        assert manager.get_priority_score("unknown") == 1.0
+
     def test_zero_cost_rejected(self):
         """Should reject zero cost (division protection)."""
         manager = OpportunityManager(min_profit_margin=0.02)
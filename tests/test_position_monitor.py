@@ -6,12 +6,19 @@ These tests verify the position monitoring and balance verification systems.
 import pytest
 import asyncio
 import sys
+from collections import deque
 import os
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from backend.services.position_monitor import PositionMonitor, BalanceManager
+from unittest.mock import MagicMock
+
+from py_clob_client.clob_types import OrderType
+from py_clob_client.order_builder.constants import SELL
+
+from backend.services.position_monitor import PositionMonitor, ExitExecutor, BalanceManager
+from backend.services.rate_limiter import APIRateLimiter
 from backend.services.risk_manager import RiskManager
 
 
@@ -234,6 +241,34 @@ class TestPositionMonitor:
 
         assert len(exits) == 0
 
+    @pytest.mark.asyncio
+    async def test_check_positions_tolerates_new_position_during_exit(self, risk_manager):
+        """A trade recorded while an exit is awaited should not abort the scan."""
+        positions = deque(maxlen=10)
+
+        async def on_exit(position, reason):
+            positions.append({'market_id': 'market-2', 'status': 'EXECUTED'})
+
+        monitor = PositionMonitor(risk_manager=risk_manager, on_exit_signal=on_exit)
+        monitor.market_details = {
+            mid: {'tokens': [{'token_id': f'{mid}-yes'}, {'token_id': f'{mid}-no'}]}
+            for mid in ('market-1', 'market-3')
+        }
+        monitor.order_books = {
+            token: {'bids': [{'price': '0.40', 'size': '100'}], 'asks': []}
+            for token in ('market-1-yes', 'market-1-no', 'market-3-yes', 'market-3-no')
+        }
+        positions.extend(
+            {'market_id': mid, 'shares': 100, 'entry_cost': 95.0, 'status': 'EXECUTED'}
+            for mid in ('market-1', 'market-3')
+        )
+        monitor.update_positions(positions)
+
+        exits = await monitor._check_positions()
+
+        assert [e['position']['market_id'] for e in exits] == ['market-1', 'market-3']
+        assert len(positions) == 4
+
     # ========================================
     # Tests for manual exit
     # ========================================
@@ -323,6 +358,49 @@ class TestPositionMonitor:
         assert positions[0]['unrealized_pnl'] == 7.0   # 102 - 95
 
 
+class TestExitExecutor:
+    """Test cases for ExitExecutor sell orders."""
+
+    @pytest.fixture
+    def client(self):
+        """Mocked ClobClient that signs orders and accepts posts."""
+        client = MagicMock()
+        client.create_order.return_value = 'signed-order'
+        client.post_order.return_value = {'success': True, 'orderID': 'abc'}
+        return client
+
+    @pytest.mark.asyncio
+    async def test_unwind_leg_posts_gtc_sell(self, client):
+        """Should sign a SELL for the leg and post it as GTC."""
+        executor = ExitExecutor(client, APIRateLimiter())
+
+        result = await executor.unwind_leg('yes-token', 52.63, 0.44)
+
+        assert result is True
+        [order_args], _ = client.create_order.call_args
+        assert order_args.token_id == 'yes-token'
+        assert order_args.side == SELL
+        assert order_args.size == 52.63
+        assert order_args.price == 0.44
+        client.post_order.assert_called_once_with('signed-order', OrderType.GTC)
+
+    @pytest.mark.asyncio
+    async def test_unwind_leg_rejected(self, client):
+        """Should report failure when the CLOB rejects the sell."""
+        client.post_order.return_value = {'success': False, 'errorMsg': 'not enough balance'}
+        executor = ExitExecutor(client, APIRateLimiter())
+
+        assert await executor.unwind_leg('yes-token', 10.0, 0.44) is False
+
+    @pytest.mark.asyncio
+    async def test_unwind_leg_error(self, client):
+        """Should report failure when placing the sell raises."""
+        client.create_order.side_effect = RuntimeError("signing failed")
+        executor = ExitExecutor(client, APIRateLimiter())
+
+        assert await executor.unwind_leg('yes-token', 10.0, 0.44) is False
+
+
 class TestBalanceManager:
     """Test cases for BalanceManager."""
 
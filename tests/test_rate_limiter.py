@@ -114,6 +114,38 @@ class TestRateLimiter:
         assert waited > 0
         assert elapsed >= 0.05  # Should have waited
 
+    @pytest.mark.asyncio
+    async def test_acquire_n_reserves_all_slots(self):
+        """Should record n requests in one call."""
+        limiter = RateLimiter(max_requests=5, time_window=1.0)
+
+        waited = await limiter.acquire_n(3)
+
+        assert waited == 0
+        assert limiter.current_usage == 3
+
+    @pytest.mark.asyncio
+    async def test_acquire_n_waits_for_enough_capacity(self):
+        """Should wait until n slots are free, not just one."""
+        limiter = RateLimiter(max_requests=2, time_window=0.1)
+
+        await limiter.acquire()
+        start = time.time()
+        waited = await limiter.acquire_n(2)
+        elapsed = time.time() - start
+
+        assert waited > 0
+        assert elapsed >= 0.05
+        assert limiter.current_usage == 2
+
+    @pytest.mark.asyncio
+    async def test_acquire_n_rejects_more_than_capacity(self):
+        """Should refuse a batch that can never fit in the window."""
+        limiter = RateLimiter(max_requests=2, time_window=1.0)
+
+        with pytest.raises(ValueError):
+            await limiter.acquire_n(3)
+
 
 class TestAPIRateLimiter:
     """Test cases for multi-endpoint API rate limiter."""
@@ -157,6 +189,16 @@ class TestAPIRateLimiter:
         # Should use default limiter
         assert limiter.limiters['default'].current_usage == 1
 
+    @pytest.mark.asyncio
+    async def test_acquire_n_counts_against_both_limits(self):
+        """Should charge n slots to the endpoint and the global limiter."""
+        limiter = APIRateLimiter()
+
+        await limiter.acquire_n('orders', 2)
+
+        assert limiter.limiters['orders'].current_usage == 2
+        assert limiter._global_limiter.current_usage == 2
+
     @pytest.mark.asyncio
     async def test_can_proceed_checks_both_limiters(self):
         """Should check both endpoint and global limiters."""
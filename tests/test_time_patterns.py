@@ -229,6 +229,19 @@ class TestMomentumDetector:
         # Now there's history to compare
         assert momentum in ['IMPROVING', 'STABLE', 'NEW']
 
+    def test_record_and_detect_matches_separate_calls(self):
+        """Combined call should record and classify like the two-step form."""
+        combined = MomentumDetector()
+        separate = MomentumDetector()
+
+        for cost in (0.97, 0.96, 0.94):
+            label = combined.record_and_detect("market_1", cost)
+            separate.record_cost("market_1", cost)
+            assert label == separate.detect_momentum("market_1", cost)
+
+        assert label == 'IMPROVING'
+        assert len(combined._cost_history["market_1"]) == 3
+
     def test_stable_momentum(self):
         """Stable cost should indicate STABLE momentum."""
         detector = MomentumDetector()
@@ -293,6 +306,27 @@ class TestMomentumDetector:
         # Old entry should be cleaned
         assert len(detector._cost_history["market_1"]) == 1
 
+    def test_history_capped_per_market(self):
+        """Should keep only the most recent max_samples observations."""
+        detector = MomentumDetector(max_samples=3)
+
+        for cost in (0.99, 0.98, 0.95, 0.95, 0.95):
+            detector.record_cost("market_1", cost)
+
+        assert [c for _, c in detector._cost_history["market_1"]] == [0.95, 0.95, 0.95]
+        assert detector.detect_momentum("market_1", 0.95) == 'STABLE'
+
+    def test_least_recently_recorded_market_evicted(self):
+        """Should forget the least recently recorded market once full."""
+        detector = MomentumDetector(max_markets=2)
+
+        detector.record_cost("market_1", 0.95)
+        detector.record_cost("market_2", 0.95)
+        detector.record_cost("market_1", 0.94)  # market_1 is now most recent
+        detector.record_cost("market_3", 0.95)
+
+        assert list(detector._cost_history) == ["market_1", "market_3"]
+
 
 class TestCombinedMultiplier:
     """Tests for combined time multiplier."""
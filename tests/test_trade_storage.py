@@ -58,6 +58,24 @@ class TestTradeStorage:
         assert id2 == id1 + 1
         assert id3 == id2 + 1
 
+    def test_save_trades_returns_ids_in_order(self, storage):
+        """Should save a batch in one call and return one ID per trade."""
+        trades = [
+            {'market_id': 'market-a', 'shares': 10, 'entry_cost': 9.5},
+            {'market_id': 'market-b', 'shares': 20, 'entry_cost': 19.0, 'status': 'CLOSED'},
+        ]
+
+        ids = storage.save_trades(trades)
+
+        assert len(ids) == 2
+        assert ids[1] == ids[0] + 1
+        assert storage.get_trade_by_id(ids[0])['market_id'] == 'market-a'
+        assert storage.get_trade_by_id(ids[1])['status'] == 'CLOSED'
+
+    def test_save_trades_empty(self, storage):
+        """Should accept an empty batch."""
+        assert storage.save_trades([]) == []
+
     def test_save_trade_with_datetime_timestamp(self, storage):
         """Should handle datetime timestamp correctly."""
         now = datetime.now()